@@ -10,34 +10,48 @@ and custom message placeholders.
 import os
 import sys
 import re
+import string
 import shutil
+import errno
+import stat
 import tempfile
 import platform
 import urllib.parse
 import logging
+import logging.handlers
+import atexit
 import random
 import time
+import json
 import threading
+import itertools
 import queue
+import socket
+from types import MappingProxyType
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import websocket # websocket-client, installed with selenium
 import gdown
 import mimetypes
-from lxml import html
+import functools
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
 from pathlib import Path
-from typing import Any, Dict, Optional, List, Tuple, Final
+from typing import Any, Dict, Mapping, Optional, List, Tuple, Final, NamedTuple
 
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
 from openpyxl.utils.exceptions import InvalidFileException
 
 # --- GUI Framework ---
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QLabel, QLineEdit, QPushButton, QTextEdit, QCheckBox, QFileDialog, QMessageBox,
+    QLabel, QLineEdit, QPushButton, QTextEdit, QPlainTextEdit, QCheckBox, QFileDialog, QMessageBox,
     QDialog, QProgressBar
 )
-from PySide6.QtCore import Qt, Signal, QObject, QThread
-from PySide6.QtGui import QFont, QCloseEvent, QClipboard
+from PySide6.QtCore import Qt, Signal, QObject, QTimer
+from PySide6.QtGui import QFont, QCloseEvent
 
 # --- Selenium Imports ---
 from selenium import webdriver
@@ -53,15 +67,10 @@ from selenium.common.exceptions import (
     TimeoutException,
     NoSuchElementException,
     WebDriverException,
-    ElementClickInterceptedException,
     StaleElementReferenceException,
-    ElementNotInteractableException,
 )
 
 # --- Webdriver Managers ---
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.core.os_manager import ChromeType
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
 
 # --- Constants ---
 CONFIG: Dict[str, Any] = {
@@ -81,6 +90,7 @@ CONFIG: Dict[str, Any] = {
             "doc_code": "Document Code",
             "media_code": "Media Code",
             "resolved_name": "_ResolvedName",
+            "rendered_message": "_RenderedMessage",
             "status": "Status",
         },
         "MSGS": {
@@ -106,9 +116,18 @@ CONFIG: Dict[str, Any] = {
             "xpath_asend": "XPATH_ASEND",
             "xpath_docs": "XPATH_DOCS",
             "xpath_media": "XPATH_MEDIA",
+            "css_text": "CSS_TEXT",
+            "css_send": "CSS_SEND",
+            "css_attach": "CSS_ATTACH",
+            "css_asend": "CSS_ASEND",
+            "css_docs": "CSS_DOCS",
+            "css_media": "CSS_MEDIA",
             "invalid_message": "INVALID_MSG",
             "min_timer": "MIN_TIMER",
             "max_timer": "MAX_TIMER",
+            "fast_save": "FAST_SAVE",
+            "gdrive_api_key": "GDRIVE_API_KEY",
+            "pool_size": "BROWSER_POOL_SIZE",
         },
         "PLACEHOLDER": {
             "keyword": "Keyword",
@@ -129,16 +148,26 @@ CONFIG: Dict[str, Any] = {
         "USE_BROWSER": "CHROME",
         "BSR_PATH": None,
         "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36 Edg/110.0.1587.69",
-        "WD_VER": None,
+        "WD_VER": None, # Chrome/Edge version to pin the driver to, major only ("114.0.5735.90" -> "114"); ignored for other browsers
         "XPATH_TEXT": '/html/body/div[1]/div/div/div[3]/div/div[4]/div/footer/div[1]/div/span/div/div[2]/div[1]/div[2]/div[1]',
         "XPATH_SEND": '/html/body/div[1]/div/div/div[3]/div/div[4]/div/footer/div[1]/div/span/div/div[2]/div[2]/button',
         "XPATH_ATTACH": '/html/body/div[1]/div/div/div[3]/div/div[4]/div/footer/div[1]/div/span/div/div[1]/div/button',
         "XPATH_ASEND": '/html/body/div[1]/div/div/div[3]/div/div[2]/div[2]/span/div/div/div/div[2]/div/div[2]/div[2]/div/div',
         "XPATH_DOCS": '//*[@id="app"]/div/span[5]/div/ul/div/div/div[1]/li/div/span',
         "XPATH_MEDIA": '//*[@id="app"]/div/span[5]/div/ul/div/div/div[2]/li/div/span',
+        # CSS selectors are tried alongside the XPaths above (whichever matches first wins); empty disables
+        "CSS_TEXT": 'footer div[contenteditable="true"]',
+        "CSS_SEND": 'footer span[data-icon="send"]',
+        "CSS_ATTACH": 'footer span[data-icon="plus"], footer span[data-icon="plus-rounded"]',
+        "CSS_ASEND": '',
+        "CSS_DOCS": '',
+        "CSS_MEDIA": '',
         "INVALID_MSG": "Phone number shared via url is invalid",
         "MIN_TIMER": "2.0",
         "MAX_TIMER": "5.0",
+        "FAST_SAVE": "FALSE",
+        "GDRIVE_API_KEY": None, # Optional; enables the Drive Files API for filename lookups
+        "BROWSER_POOL_SIZE": "2", # Concurrent browser instances used for a run (1 to MAX_BROWSER_POOL_SIZE)
     }
 }
 
@@ -148,41 +177,117 @@ _SETTINGS_COLS = CONFIG["COLUMNS"]["SETTINGS"]
 _PLACEHOLDER_COLS = CONFIG["COLUMNS"]["PLACEHOLDER"]
 _BROWSER_COLS = CONFIG["COLUMNS"]["BROWSER"]
 _STATUS_VALS = CONFIG["STATUS_VALUES"]
+_STATUS_FLUSH_INTERVAL_MS: Final = 30_000 # Periodic status save while a run is active
+_STOP_GRACE_S: Final = 5.0 # How long a stop waits for workers to finish their current contact
+_INTERRUPT_GRACE_S: Final = 1.0 # How long workers get to return once their browser calls are interrupted
+_QUIT_WAIT_S: Final = 1.0 # How long exit waits for the browsers to quit
+_CODEC_SYNC_MAX_CHARS: Final = 20_000 # Longer codec inputs are processed off the GUI thread
+_WAIT_POLL_S: Final = 0.25 # WebDriverWait poll interval (Selenium's default is 0.5s)
+_PROGRESS_EMIT_INTERVAL_S: Final = 0.05 # At most ~20 progress-bar updates per second from the workers
+
+# Spintax groups like [option1|option2]; innermost groups only (no nested brackets/braces)
+_SPINTAX_RE: Final = re.compile(r"\[([^{}\[\]]+?)\]")
 
 # --- Logging Setup ---
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s",
-    handlers=[
-        logging.FileHandler("whatsapp_blaster.log", encoding='utf-8'),
-        logging.StreamHandler()
-    ],
-)
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Enqueues records as-is; the listener thread formats them (tracebacks included) and does the file I/O."""
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+_log_formatter = logging.Formatter("%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s")
+_log_handlers: List[logging.Handler] = [logging.FileHandler("whatsapp_blaster.log", encoding='utf-8'), logging.StreamHandler()]
+for _handler in _log_handlers:
+    _handler.setFormatter(_log_formatter)
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, *_log_handlers, respect_handler_level=True)
+logging.basicConfig(level=logging.INFO, handlers=[_DeferredQueueHandler(_log_queue)])
+_log_listener.start()
+atexit.register(_log_listener.stop) # Flushes the queued records on exit
 
 # --- Global Signals for GUI Updates from Threads ---
 class Signals(QObject):
-    log_system_signal = Signal(str)
-    log_browser1_signal = Signal(str)
-    log_browser2_signal = Signal(str)
+    log_system_batch_signal = Signal(list)
+    log_browser1_batch_signal = Signal(list)
+    log_browser2_batch_signal = Signal(list)
     processing_started = Signal()
     processing_stopped = Signal()
     update_progress = Signal(int, int)
+    excel_loaded = Signal(str, object, object) # path, settings, browsers_map
+    excel_load_failed = Signal(str, str) # path, error
+    codec_done = Signal(object, str) # output widget, result
+    codec_failed = Signal(str, str) # mode, error
+    show_message = Signal(str, str, str) # "warning" or "critical", title, text; for message boxes from worker threads
 
 global_signals: Optional[Signals] = None
 
 # --- Thread-Safe Logging Functions ---
+# Worker threads only append to a bounded per-pane buffer; the GUI drains the buffers on a timer and emits one batch per pane.
+# If the GUI falls behind, the oldest lines are dropped from the panes (the log file still has every line).
+_LOG_PANE_SYSTEM, _LOG_PANE_BROWSER1, _LOG_PANE_BROWSER2 = 0, 1, 2
+_LOG_FLUSH_INTERVAL_MS: Final = 100
+_LOG_FLUSH_MAX_BATCH: Final = 500
+_LOG_BUFFER_MAX_LINES: Final = 1000
+_LOG_MAX_LINES: Final = 2000
+_log_buffers: Final = tuple(deque(maxlen=_LOG_BUFFER_MAX_LINES) for _ in range(3))
+
 def log_system(message: str) -> None:
     logging.info(message)
-    if global_signals: global_signals.log_system_signal.emit(message)
+    if global_signals: _log_buffers[_LOG_PANE_SYSTEM].append(message)
 
 def log_browser(instance_id: int, message: str) -> None:
     log_entry = f"[Instance {instance_id}] {message}"
     logging.info(log_entry)
     if global_signals:
-        if instance_id == 1: global_signals.log_browser1_signal.emit(log_entry)
-        else: global_signals.log_browser2_signal.emit(log_entry)
+        _log_buffers[_LOG_PANE_BROWSER1 if instance_id == 1 else _LOG_PANE_BROWSER2].append(log_entry)
+
+def _drain_log_buffer(buffer: "deque[str]", max_items: int) -> List[str]:
+    lines: List[str] = []
+    popleft = buffer.popleft
+    for _ in range(max_items):
+        try:
+            lines.append(popleft())
+        except IndexError:
+            break
+    return lines
+
+def flush_log_queue(max_items: int = _LOG_FLUSH_MAX_BATCH) -> None:
+    """Drains up to max_items buffered log lines per pane and emits a single batch signal per log pane. GUI thread only."""
+    if not global_signals: return
+    sys_batch, b1_batch, b2_batch = (_drain_log_buffer(buffer, max_items) for buffer in _log_buffers)
+    if sys_batch: global_signals.log_system_batch_signal.emit(sys_batch)
+    if b1_batch: global_signals.log_browser1_batch_signal.emit(b1_batch)
+    if b2_batch: global_signals.log_browser2_batch_signal.emit(b2_batch)
 
 # --- Utility Functions ---
+# Google Drive downloads are kept across runs, one folder per Drive file ID
+GDRIVE_CACHE_DIR: Final = Path.home() / ".cache" / "wa_blaster" / "gdrive"
+_GDRIVE_URL_RE: Final = re.compile(r"drive\.google\.com/(?:.*/)?(?:file/d/|uc\?|open\?|view\?id=)", re.IGNORECASE)
+# /file/d/<id> links and ?id= / &id= query forms (uc?id=, open?id=, ...) in one pass
+_GDRIVE_ID_RE: Final = re.compile(r'(?:/file/d/|[?&]id=)([a-zA-Z0-9_-]+)')
+# Where a Drive file page exposes the original filename
+_GDRIVE_FILENAME_RES: Final = tuple(re.compile(pattern) for pattern in (
+    r'"title":"([^"]+)"',
+    r'<title>([^<]+) - Google Drive</title>',
+    r'"filename":"([^"]+)"',
+    r'data-filename="([^"]+)"',
+))
+_GDRIVE_DOWNLOAD_WORKERS: Final = 8
+_GDRIVE_INDEX_FILE: Final = ".gdrive_index.json" # file_id -> {"path", "size"} of completed downloads
+_GDRIVE_DOWNLOAD_TIMEOUT: Final = (5, 60) # (connect, read) seconds
+_GDRIVE_FILES_API_URL: Final = "https://www.googleapis.com/drive/v3/files/{file_id}"
+# file_id -> (name, mimeType) from the Files API; names don't change within a session
+_gdrive_metadata_cache: Dict[str, Tuple[str, Optional[str]]] = {}
+# File signatures used to pick an extension for downloads that arrive without one
+_MAGIC_EXTENSIONS: Final = {
+    b'%PDF': '.pdf',
+    b'\xff\xd8\xff': '.jpg',
+    b'\x89PNG': '.png',
+    b'GIF8': '.gif',
+    b'PK': '.zip',  # Could also be docx, xlsx, etc.
+}
+_MAGIC_PREFIX_LENS: Final = sorted({len(prefix) for prefix in _MAGIC_EXTENSIONS}, reverse=True)
+mimetypes.init() # Parse the system MIME tables once at import instead of on the first lookup mid-download
+
 def get_persistent_temp_path(instance_id: str) -> Path:
     base = Path(tempfile.gettempdir())
     folder = f"whatsapp_blaster_data_{instance_id}"
@@ -191,159 +296,588 @@ def get_persistent_temp_path(instance_id: str) -> Path:
     return path
 
 def normalize_value(value: Any) -> str:
+    # Dispatch on the common scalar types first; pd.isna is only needed for rarer missing markers (pd.NA, NaT)
+    if isinstance(value, str):
+        return value.strip()
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        if value != value: # NaN
+            return ""
+        return str(int(value)) if value.is_integer() else str(value).strip()
+    if isinstance(value, int):
+        return str(value)
     if pd.isna(value):
         return ""
-    if isinstance(value, float) and value.is_integer():
-        return str(int(value)).strip()
     return str(value).strip()
 
+def normalize_series(series: pd.Series) -> pd.Series:
+    """
+    Column-wise normalize_value: integer-valued floats lose their '.0', missing values become '' and
+    everything is stripped with pandas string ops instead of a Python call per cell.
+    """
+    if pd.api.types.is_float_dtype(series.dtype):
+        whole = series.notna() & (series % 1 == 0) & (series.abs() < 2**63)
+        converted = series.astype(object)
+        converted[whole] = series[whole].astype("int64").astype(str)
+        series = converted
+    elif series.dtype == object:
+        # Mixed cells (e.g. read with dtype=object): only the float cells need the integer handling
+        is_float = series.map(type).eq(float)
+        if is_float.any():
+            series = series.copy()
+            series[is_float] = normalize_series(series[is_float].astype(float))
+    return series.fillna("").astype(str).str.strip()
+
+@functools.lru_cache(maxsize=4096)
+def expand_path(raw_path: str) -> str:
+    """os.path.expandvars, cached: the same paths repeat across BROWSER/DOCS/MEDIA rows."""
+    return os.path.expandvars(raw_path)
+
+def replace_file(src: Any, dst: Any) -> None:
+    """Atomic same-filesystem rename (a single rename syscall); copies only if src and dst are on different devices."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(src), str(dst))
+
+@functools.lru_cache(maxsize=128)
+def extension_for_mime(content_type: str) -> str:
+    """Cached mimetypes.guess_extension; '' when the type is unknown."""
+    return mimetypes.guess_extension(content_type) or ""
+
+def classify_path(path: str) -> str:
+    """Classifies a path with a single stat() call: 'file', 'dir', 'other' or 'missing'."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return "missing"
+    if stat.S_ISREG(st.st_mode):
+        return "file"
+    return "dir" if stat.S_ISDIR(st.st_mode) else "other"
+
+def classify_paths(paths: List[str]) -> Dict[str, Tuple[str, str]]:
+    """
+    Batch classify_path for many paths: lists each parent directory once with os.scandir instead of stat()ing
+    every path, and resolves each directory once. Returns {path: (kind, absolute_path)}. Names missing from
+    the listing (e.g. different case on Windows) fall back to a single stat().
+    """
+    by_dir: Dict[str, List[str]] = {}
+    for path in dict.fromkeys(paths):
+        by_dir.setdefault(os.path.dirname(os.path.abspath(path)), []).append(path)
+    results: Dict[str, Tuple[str, str]] = {}
+    for directory, dir_paths in by_dir.items():
+        kinds: Dict[str, str] = {}
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        kinds[entry.name] = "file" if entry.is_file() else "dir" if entry.is_dir() else "other"
+                    except OSError:
+                        kinds[entry.name] = "missing"
+        except (OSError, ValueError):
+            pass
+        resolved_dir = Path(directory).resolve() if kinds else Path(directory)
+        for path in dir_paths:
+            name = os.path.basename(path)
+            kind = kinds.get(name) or classify_path(path)
+            results[path] = (kind, str(resolved_dir / name) if name in kinds else str(Path(path).resolve()))
+    return results
+
+def regular_file_size(path: Any) -> Optional[int]:
+    """Size of a regular file from a single stat() call; None if it is missing or not a regular file."""
+    try:
+        st = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return st.st_size if stat.S_ISREG(st.st_mode) else None
+
+def is_regular_file(path: Any) -> bool:
+    """Single-stat replacement for path.exists() and path.is_file()."""
+    return regular_file_size(path) is not None
+
+def collect_row_values(df: pd.DataFrame, columns: List[str], transform: Any) -> Dict[Any, List[str]]:
+    """
+    Returns {row_index: [values]} with the non-empty, transformed values of the given columns in column order.
+    Melts the columns into one long Series instead of building a Series per row with iterrows.
+    """
+    present_cols = [col for col in columns if col in df.columns]
+    if not present_cols or df.empty:
+        return {}
+    values = df[present_cols].melt(value_vars=present_cols, ignore_index=False)["value"].dropna()
+    values = values.sort_index(kind="stable").map(transform)
+    values = values[values != ""]
+    return values.groupby(level=0, sort=False).agg(list).to_dict()
+
+def is_truthy_setting(value: Any) -> bool:
+    return normalize_value(value).upper() in ("TRUE", "YES", "Y", "1")
+
 # --- Excel File Locking ---
-excel_lock = threading.Lock()
-def is_file_locked(filepath: str) -> bool:
-    lock_path = Path(f"{filepath}.lock")
-    if lock_path.exists():
+if os.name == "nt":
+    import msvcrt
+
+    def _lock_fd(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+
+    def _unlock_fd(fd: int) -> None:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+
+    def _lock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    def _unlock_fd(fd: int) -> None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+class ExcelFileLock:
+    """
+    OS-level advisory lock on '<excel_file>.lock' (flock on POSIX, msvcrt.locking on Windows).
+    Granted immediately when free; the OS drops it if the process dies, so there are no stale locks.
+    Separate acquisitions conflict even between threads of this process.
+    """
+    def __init__(self, filepath: str, timeout: float = 5.0, poll_interval: float = 0.05) -> None:
+        self.lock_path = f"{filepath}.lock"
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    def acquire(self) -> bool:
         try:
-            if (time.time() - lock_path.stat().st_mtime) > 60:
-                log_system(f"Warning: Stale lock file found for {filepath}, removing.")
-                lock_path.unlink()
-                return False
-            else:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_RDWR)
+        except OSError as e:
+            log_system(f"IOError opening lock file {self.lock_path}: {e}")
+            return False
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                _lock_fd(fd)
+                self._fd = fd
                 return True
-        except OSError:
-            return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    return False
+                time.sleep(self.poll_interval)
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            _unlock_fd(self._fd)
+        except OSError as e:
+            log_system(f"Error releasing lock file {self.lock_path}: {e}")
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> "ExcelFileLock":
+        if not self.acquire():
+            raise TimeoutError(f"Could not lock {self.lock_path} within {self.timeout}s")
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.release()
+
+# --- Batch Excel Update Function ---
+def _status_header_columns(header_row: Tuple[Any, ...]) -> Optional[Tuple[int, int]]:
+    """Returns the 1-based (phone_col_idx, status_col_idx) from the LIST header row, or None if missing."""
+    phone_col_name, status_col_name = _LIST_COLS["phone"], _LIST_COLS["status"]
+    headers = list(header_row)
+    try:
+        return headers.index(phone_col_name) + 1, headers.index(status_col_name) + 1
+    except ValueError:
+        log_system(f"Error: Columns '{phone_col_name}' or '{status_col_name}' not found. Batch update failed.")
+        return None
+
+def _find_status_rows(excel_file: str, statuses_to_update: Dict[str, int]) -> Optional[Tuple[int, List[Tuple[int, str]]]]:
+    """
+    Streams the LIST sheet in read-only mode and returns (status_col_idx, [(row_idx, phone), ...])
+    for every row whose phone needs a status update. Returns None if the sheet/columns are missing.
+    """
+    list_sheet_name = CONFIG["SHEETS"]["LIST"]
+    ro_wb = load_workbook(excel_file, read_only=True, data_only=True)
     try:
-        open(lock_path, 'x').close()
+        if list_sheet_name not in ro_wb.sheetnames:
+            log_system(f"Error: Sheet '{list_sheet_name}' not found. Batch update failed.")
+            return None
+        ro_sheet = ro_wb[list_sheet_name]
+        ro_sheet.reset_dimensions()  # Don't trust the stored dimension; rows may be ragged
+        rows = ro_sheet.iter_rows(values_only=True)
+        columns = _status_header_columns(next(rows, ()))
+        if columns is None:
+            return None
+        phone_pos, status_col_idx = columns[0] - 1, columns[1]
+        rows_to_update = []
+        for row_idx, row in enumerate(rows, start=2):
+            if phone_pos < len(row):
+                phone_number = normalize_value(row[phone_pos])
+                if phone_number in statuses_to_update:
+                    rows_to_update.append((row_idx, phone_number))
+        return status_col_idx, rows_to_update
+    finally:
+        ro_wb.close()
+
+def _rewrite_statuses_with_pandas(excel_file: str, statuses_to_update: Dict[str, int]) -> bool:
+    """
+    FAST_SAVE path: read every sheet with pandas, map the new statuses onto the LIST sheet in one
+    vectorized pass and rewrite the workbook with xlsxwriter. Cell styles and formulas are NOT kept.
+    Raises ImportError if xlsxwriter is not installed.
+    """
+    list_sheet_name = CONFIG["SHEETS"]["LIST"]
+    phone_col_name, status_col_name = _LIST_COLS["phone"], _LIST_COLS["status"]
+    sheets = pd.read_excel(excel_file, sheet_name=None, dtype=object)
+    list_df = sheets.get(list_sheet_name)
+    if list_df is None:
+        log_system(f"Error: Sheet '{list_sheet_name}' not found. Batch update failed.")
         return False
-    except FileExistsError: 
-        return True
-    except IOError as e:
-        log_system(f"IOError checking lock for {filepath}: {e}")
-        return True
+    if phone_col_name not in list_df.columns or status_col_name not in list_df.columns:
+        log_system(f"Error: Columns '{phone_col_name}' or '{status_col_name}' not found. Batch update failed.")
+        return False
+    new_statuses = normalize_series(list_df[phone_col_name]).map(statuses_to_update)
+    log_system(f"Batch update: Mapped {int(new_statuses.notna().sum())} statuses in memory.")
+    list_df[status_col_name] = new_statuses.fillna(list_df[status_col_name])
 
-def release_lock(filepath: str):
-    lock_path = Path(f"{filepath}.lock")
+    # Write next to the original and swap in, so a failed write never leaves a truncated workbook
+    tmp_path = f"{excel_file}.tmp.xlsx"
     try:
-        if lock_path.exists():
-            lock_path.unlink()
-    except OSError as e:
-        log_system(f"Error removing lock file {lock_path}: {e}")
+        with pd.ExcelWriter(tmp_path, engine="xlsxwriter") as writer:
+            for sheet_name, sheet_df in sheets.items():
+                sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
+        os.replace(tmp_path, excel_file)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return True
+
+class StatusWorkbook:
+    """
+    Keeps the full workbook loaded between status flushes, so repeated flushes during a run only cost a save
+    instead of a full unzip + XML parse each time. The workbook is reloaded if the file changed on disk since
+    our last save (e.g. edited in Excel), so outside edits are never overwritten with a stale copy.
+    """
+    def __init__(self, excel_file: str) -> None:
+        self.excel_file = excel_file
+        self.wb: Optional[Workbook] = None
+        try:
+            self._saved_mtime_ns: Optional[int] = self._file_mtime_ns() # As loaded by ExcelDataLoader
+        except OSError:
+            self._saved_mtime_ns = None
 
-# --- Batch Excel Update Function ---
-def perform_batch_update(excel_file: str, statuses_to_update: Dict[str, int]) -> bool:
-    """Updates the Excel file status column in batch using openpyxl."""
+    def _file_mtime_ns(self) -> int:
+        return os.stat(self.excel_file).st_mtime_ns
+
+    def get(self) -> Workbook:
+        if self.wb is None or self._file_mtime_ns() != self._saved_mtime_ns:
+            self.close()
+            self.wb = load_workbook(self.excel_file)
+            self._saved_mtime_ns = self._file_mtime_ns()
+        return self.wb
+
+    def mark_saved(self) -> None:
+        self._saved_mtime_ns = self._file_mtime_ns()
+
+    def changed_on_disk(self) -> bool:
+        """True if something other than our own saves (e.g. Excel, or a FAST_SAVE rewrite) modified the file."""
+        try:
+            return self._file_mtime_ns() != self._saved_mtime_ns
+        except OSError:
+            return True
+
+    def close(self) -> None:
+        if self.wb is not None:
+            try: self.wb.close()
+            except Exception: pass
+        self.wb = None
+        self._saved_mtime_ns = None
+
+class StatusJournal:
+    """
+    Appends every worker result to '<excel file>.statuses.log' (line-buffered, no fsync per write) before it is
+    queued, so statuses that never reached a batch save survive a crash and are written on the next run.
+    """
+    def __init__(self, excel_file: str, status_queue: "queue.SimpleQueue[Tuple[str, int]]") -> None:
+        self.path = self.journal_path(excel_file)
+        self.status_queue = status_queue
+        self._lock = threading.Lock()
+        self._file = None
+        self._closed = False
+
+    @staticmethod
+    def journal_path(excel_file: str) -> str:
+        return f"{excel_file}.statuses.log"
+
+    def put(self, item: Tuple[str, int]) -> None:
+        phone, status = item
+        with self._lock:
+            if not self._closed:
+                try:
+                    if self._file is None:
+                        self._file = open(self.path, "a", encoding="utf-8", buffering=1) # Opened once per run
+                    self._file.write(f"{phone}\t{status}\n")
+                except OSError as e:
+                    log_system(f"Warning: Could not write status journal '{self.path}': {e}")
+                    self._closed = True
+        self.status_queue.put(item)
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            if self._file is not None:
+                try: self._file.close()
+                except OSError: pass
+                self._file = None
+
+    def discard(self) -> None:
+        """Closes and removes the journal once every status in it is saved to the workbook."""
+        self.close()
+        try: os.remove(self.path)
+        except FileNotFoundError: pass
+        except OSError as e: log_system(f"Warning: Could not remove status journal '{self.path}': {e}")
+
+    @staticmethod
+    def read(excel_file: str) -> Dict[str, int]:
+        """Statuses left by a run that ended before saving them; later lines win, malformed lines are skipped."""
+        statuses: Dict[str, int] = {}
+        try:
+            with open(StatusJournal.journal_path(excel_file), encoding="utf-8") as journal:
+                for line in journal:
+                    phone, sep, status = line.rstrip("\n").partition("\t")
+                    if sep and phone and status.lstrip("-").isdigit():
+                        statuses[phone] = int(status)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            log_system(f"Warning: Could not read status journal for '{excel_file}': {e}")
+        return statuses
+
+def perform_batch_update(excel_file: str,
+                         statuses_to_update: Dict[str, int],
+                         fast_rewrite: bool = False,
+                         phone_to_row_idx: Optional[Dict[str, List[int]]] = None,
+                         status_workbook: Optional[StatusWorkbook] = None) -> bool:
+    """
+    Updates the Excel file status column in batch using openpyxl.
+    phone_to_row_idx (from ExcelDataLoader) maps phones straight to sheet rows; it is verified against
+    the sheet before writing and the LIST sheet is rescanned if rows moved since it was built.
+    status_workbook keeps the parsed workbook between calls instead of reloading it for every flush.
+    With fast_rewrite (FAST_SAVE setting) the workbook is rewritten via pandas + xlsxwriter instead,
+    which is faster on large sheets but drops formatting; macro workbooks (.xlsm) always use openpyxl.
+    """
     if not statuses_to_update:
         log_system("Batch update skipped: No statuses.")
         return True
     log_system(f"Starting batch update for {len(statuses_to_update)} statuses in '{excel_file}'...")
     max_attempts, retry_delay = 3, 2
     list_sheet_name = CONFIG["SHEETS"]["LIST"]
-    phone_col_name, status_col_name = _LIST_COLS["phone"], _LIST_COLS["status"]
+    use_fast_rewrite = fast_rewrite and not excel_file.lower().endswith(".xlsm")
+    open_workbook = status_workbook.get if status_workbook else lambda: load_workbook(excel_file)
     success = False
     for attempt in range(max_attempts):
-        if is_file_locked(excel_file):
+        file_lock = ExcelFileLock(excel_file)
+        if not file_lock.acquire():
             log_system(f"Excel file locked. Attempt {attempt + 1}/{max_attempts}. Retrying...")
-            time.sleep(retry_delay)
             continue
-        with excel_lock:
-            try:
-                wb = load_workbook(excel_file)
+        wb = None
+        try:
+            if use_fast_rewrite:
+                try:
+                    saved = _rewrite_statuses_with_pandas(excel_file, statuses_to_update)
+                    if saved: log_system("Batch update saved (fast rewrite).")
+                    return saved
+                except ImportError:
+                    log_system("Warning: FAST_SAVE requires the 'xlsxwriter' package. Falling back to openpyxl.")
+                    use_fast_rewrite = False
+            rows_to_update = None
+            status_col_idx = None
+            if phone_to_row_idx is not None:
+                indexed_rows = [(row_idx, phone) for phone in statuses_to_update for row_idx in phone_to_row_idx.get(phone, ())]
+                if not indexed_rows:
+                    log_system("Batch update: No matching rows, nothing to save.")
+                    return True
+                wb = open_workbook()
                 if list_sheet_name not in wb.sheetnames:
                     log_system(f"Error: Sheet '{list_sheet_name}' not found. Batch update failed.")
-                    release_lock(excel_file)
                     return False
                 sheet = wb[list_sheet_name]
-                headers = [cell.value for cell in sheet[1]]
-                try:
-                    phone_col_idx = headers.index(phone_col_name) + 1
-                    status_col_idx = headers.index(status_col_name) + 1
-                except ValueError:
-                    log_system(f"Error: Columns '{phone_col_name}' or '{status_col_name}' not found. Batch update failed.")
-                    wb.close()
-                    release_lock(excel_file)
+                columns = _status_header_columns(next(sheet.iter_rows(max_row=1, values_only=True), ()))
+                if columns is None:
                     return False
-                updated_count = 0
-                for row_idx in range(2, sheet.max_row + 1):
-                    phone_number = normalize_value(sheet.cell(row=row_idx, column=phone_col_idx).value)
-                    if phone_number in statuses_to_update:
-                        sheet.cell(row=row_idx, column=status_col_idx, value=statuses_to_update[phone_number])
-                        updated_count += 1
-                log_system(f"Batch update: Mapped {updated_count} statuses in memory.")
-                wb.save(excel_file)
-                wb.close()
-                release_lock(excel_file)
-                log_system(f"Batch update saved.")
-                success = True
-                return True
-            except InvalidFileException:
-                log_system(f"Error: '{excel_file}' invalid/corrupted. Batch update failed.")
-                release_lock(excel_file)
-                return False
-            except Exception as e:
-                log_system(f"Error during batch update attempt {attempt + 1}: {e}")
-                logging.exception("Batch Update Traceback:")
-                try: wb.close()
-                except: pass
-                if attempt < max_attempts - 1: 
-                    time.sleep(retry_delay)
+                phone_col_idx, status_col_idx = columns
+                max_row = sheet.max_row
+                if all(row_idx <= max_row and normalize_value(sheet.cell(row=row_idx, column=phone_col_idx).value) == phone
+                       for row_idx, phone in indexed_rows):
+                    rows_to_update = indexed_rows
                 else:
-                    release_lock(excel_file)
+                    log_system("Batch update: LIST rows changed since loading, rescanning sheet.")
+            if rows_to_update is None:
+                # Cheap streaming scan to locate the rows that actually change
+                located = _find_status_rows(excel_file, statuses_to_update)
+                if located is None:
+                    return False
+                status_col_idx, rows_to_update = located
+                if not rows_to_update:
+                    log_system("Batch update: No matching rows, nothing to save.")
+                    return True
+            log_system(f"Batch update: Mapped {len(rows_to_update)} statuses in memory.")
+            if wb is None:
+                # Full load only to write the targeted status cells and save
+                wb = open_workbook()
+                sheet = wb[list_sheet_name]
+            for row_idx, phone_number in rows_to_update:
+                sheet.cell(row=row_idx, column=status_col_idx, value=statuses_to_update[phone_number])
+            wb.save(excel_file)
+            if status_workbook:
+                status_workbook.mark_saved()
+            else:
+                wb.close()
+            log_system("Batch update saved.")
+            success = True
+            return True
+        except InvalidFileException:
+            log_system(f"Error: '{excel_file}' invalid/corrupted. Batch update failed.")
+            return False
+        except Exception as e:
+            log_system(f"Error during batch update attempt {attempt + 1}: {e}")
+            logging.exception("Batch Update Traceback:")
+            try:
+                if status_workbook: status_workbook.close() # Reload a clean copy on the next attempt
+                elif wb: wb.close()
+            except Exception: pass
+            if attempt < max_attempts - 1: 
+                time.sleep(retry_delay)
+        finally:
+            file_lock.release()
     if not success: log_system(f"Batch update failed after {max_attempts} attempts.")
     return success
 
 # --- Message Personalization (Modified for Custom Placeholders) ---
+def _pick_spintax_option(match: "re.Match[str]") -> str:
+    return random.choice(match.group(1).split("|")).strip() # Only the picked option needs stripping
+
 def parse_spintax(text: str) -> str:
     """Process spintax like [option1|option2] randomly."""
-    pattern = re.compile(r"\[([^{}\[\]]+?)\]")
-    while match := pattern.search(text):
-        options = [opt.strip() for opt in match.group(1).split("|")]
-        text = text[:match.start()] + random.choice(options) + text[match.end():]
+    # Each sub() pass resolves every innermost group in one scan; nested groups resolve outwards.
+    while _SPINTAX_RE.search(text):
+        text = _SPINTAX_RE.sub(_pick_spintax_option, text)
     return text
 
-def personalize_message(encoded_template: str, contact_details: Dict[str, Any], custom_placeholders: Dict[str, str]) -> str:
+_TEMPLATE_FORMATTER: Final = string.Formatter()
+
+TemplatePart = Tuple[str, Optional[str], str, Optional[str]] # (literal, list_header, format_spec, conversion)
+
+@functools.lru_cache(maxsize=256)
+def compile_template(decoded_template: str, placeholder_items: Tuple[Tuple[str, str], ...]) -> Tuple[TemplatePart, ...]:
+    """
+    Parses a decoded template once and maps each placeholder to its LIST column header.
+    placeholder_items is tuple(custom_placeholders.items()). Unknown placeholders get a None header
+    (rendered as "") and are reported once per template here instead of once per contact.
+    """
+    headers = dict(placeholder_items)
+    parts: List[TemplatePart] = []
+    for literal, field_name, format_spec, conversion in _TEMPLATE_FORMATTER.parse(decoded_template):
+        list_header = None
+        if field_name is not None:
+            list_header = headers.get(field_name)
+            if list_header is None:
+                log_system(f"Warning: Placeholder '{{{field_name}}}' used in message template but not found in available data (standard or custom). Removing placeholder.")
+        parts.append((literal, list_header, format_spec or "", conversion))
+    return tuple(parts)
+
+def _format_part(value: Any, format_spec: str, conversion: Optional[str]) -> str:
+    if conversion:
+        value = _TEMPLATE_FORMATTER.convert_field(value, conversion)
+    return format(value, format_spec) if format_spec else value
+
+def personalize_message(decoded_template: str, contact_details: Dict[str, Any], custom_placeholders: Dict[str, str]) -> str:
     """
-    Decode, substitute standard & custom placeholders, process spintax, and re-encode.
+    Substitute standard & custom placeholders, process spintax, and URL-encode.
     Args:
-        encoded_template: The URL-encoded message template.
+        decoded_template: The message template, already URL-decoded by the loader.
         contact_details: Dictionary representing the contact's row data from LIST sheet.
         custom_placeholders: Dictionary mapping {placeholder_keyword: list_column_header}.
     """
-    if not encoded_template or pd.isna(encoded_template):
+    if not decoded_template or pd.isna(decoded_template):
         return ""
-    try:
-        decoded_template = urllib.parse.unquote_plus(str(encoded_template))
-    except Exception as e:
-        logging.error(f"Error decoding template: {e}. Template: {encoded_template}")
-        return ""
-
-    # 1. Build the formatting dictionary including custom placeholders
-    format_data = {}
-    for keyword, list_header in custom_placeholders.items():
-        # Get value from contact details using the header specified in PLACEHOLDER sheet
-        format_data[keyword] = normalize_value(contact_details.get(list_header, ""))
 
-    # 3. Perform formatting
+    # Substitute placeholders from the template's compiled parts (missing placeholders are removed)
     try:
-        personalized = decoded_template.format(**format_data)
-    except KeyError as e:
-        placeholder_key = str(e).strip("'\"")
-        if re.match(r"^{.+}$", decoded_template): # Check if template had placeholders
-            log_system(f"Warning: Placeholder '{{{placeholder_key}}}' used in message template but not found in available data (standard or custom) for contact {contact_details.get(_LIST_COLS['phone'], 'N/A')}. Removing placeholder.")
-        else: # Error is likely due to curly braces used for non-placeholder reasons
-            log_system(f"Warning: Formatting error likely due to unexpected curly braces in message template for {contact_details.get(_LIST_COLS['phone'], 'N/A')}. Check template structure.")
-        # Attempt to continue by removing the problematic key indication if it's simple
-        # This is basic, might fail for complex templates. Better fix is usually correcting the template/data.
-        personalized = decoded_template.replace(f"{{{placeholder_key}}}", "")
+        chunks: List[str] = []
+        for literal, list_header, format_spec, conversion in compile_template(decoded_template, tuple(custom_placeholders.items())):
+            chunks.append(literal)
+            if list_header is not None:
+                chunks.append(_format_part(normalize_value(contact_details.get(list_header, "")), format_spec, conversion))
+        personalized = "".join(chunks)
     except Exception as e:
         logging.error(f"Error formatting message: {e}. Template: {decoded_template}, Details: {contact_details}")
         personalized = decoded_template # Fallback
 
-    # 4. Process Spintax and Re-encode
+    # Process Spintax and Re-encode
     spintax_processed = parse_spintax(personalized)
-    return urllib.parse.quote_plus(spintax_processed)
+    return urllib.parse.quote_from_bytes(spintax_processed.encode("utf-8"), safe="")
+
+def render_messages(decoded_template: str, contacts: pd.DataFrame, custom_placeholders: Dict[str, str]) -> pd.Series:
+    """
+    Vectorized personalize_message for many contacts sharing one template: placeholders are substituted
+    column-wise, then spintax and URL-encoding run per row. Returns the encoded messages indexed like contacts.
+    """
+    if not decoded_template or contacts.empty:
+        return pd.Series("", index=contacts.index, dtype=object)
+    try:
+        rendered = pd.Series("", index=contacts.index, dtype=object)
+        for literal, list_header, format_spec, conversion in compile_template(decoded_template, tuple(custom_placeholders.items())):
+            if literal:
+                rendered = rendered + literal
+            if list_header is None:
+                continue
+            if list_header in contacts.columns:
+                values = normalize_series(contacts[list_header]).astype(object)
+            else:
+                values = pd.Series("", index=contacts.index, dtype=object)
+            if conversion or format_spec:
+                values = values.map(lambda v: _format_part(v, format_spec, conversion))
+            rendered = rendered + values
+    except Exception as e:
+        logging.error(f"Error formatting message: {e}. Template: {decoded_template}")
+        rendered = pd.Series(decoded_template, index=contacts.index, dtype=object) # Fallback
+    return rendered.map(lambda text: urllib.parse.quote_from_bytes(parse_spintax(text).encode("utf-8"), safe=""))
 
 
 # --- Excel Data Loader (Modified for Custom Placeholders) ---
 class ExcelDataLoader:
+    # Loaders keyed on (path, mtime, size). Our own status saves change the mtime, so a hit only happens while the
+    # file is untouched, e.g. the settings check followed by Start. The maps of a cached loader are shared: read-only.
+    _CACHE_MAX_ENTRIES: Final = 4
+    _cache: "OrderedDict[Tuple[str, int, int], ExcelDataLoader]" = OrderedDict()
+    _cache_lock = threading.Lock()
+
+    @classmethod
+    def load(cls, excel_file: str) -> "ExcelDataLoader":
+        """Returns the cached loader for this exact version of the file, loading (and caching) it on a miss."""
+        file_stat = os.stat(excel_file)
+        key = (os.path.abspath(excel_file), file_stat.st_mtime_ns, file_stat.st_size)
+        with cls._cache_lock:
+            loader = cls._cache.get(key)
+            if loader is not None:
+                cls._cache.move_to_end(key)
+                log_system(f"Using cached data for {excel_file} (unchanged since last load).")
+                return loader
+        loader = cls(excel_file)
+        with cls._cache_lock:
+            cls._cache[key] = loader
+            while len(cls._cache) > cls._CACHE_MAX_ENTRIES:
+                cls._cache.popitem(last=False)
+        return loader
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        with cls._cache_lock:
+            cls._cache.clear()
+
     def __init__(self, excel_file: str) -> None:
         self.excel_file = excel_file
         self.sheets: Dict[str, pd.DataFrame] = {}
@@ -354,21 +888,39 @@ class ExcelDataLoader:
         self.media_map: Dict[str, List[str]] = {}
         self.custom_placeholders: Dict[str, str] = {}
         self.browsers_map: Dict[str, List[str]] = {}
-
-        # Create a temporary directory for Google Drive downloads for this session
-        self.gdrive_download_cache = Path(tempfile.gettempdir()) / "wa_blaster_gdrive_downloads_cache"
+        self.phone_to_row_idx: Dict[str, List[int]] = {}
+        self.status_workbook = StatusWorkbook(excel_file) # Loaded lazily on the first status flush
+        self._http = self._create_http_session() # Keep-alive session shared by all Google Drive requests
+        self._xls: Optional[pd.ExcelFile] = None # Open only while _load_data runs
+        self._xls_lock = threading.Lock() # DOCS/MEDIA parse from _xls on a background thread while the rest load
+
+        # Persistent, user-scoped cache for Google Drive downloads (reused across runs)
+        self.gdrive_download_cache = GDRIVE_CACHE_DIR
         self.gdrive_download_cache.mkdir(parents=True, exist_ok=True)
         log_system(f"Google Drive download cache directory: {self.gdrive_download_cache}")
+        self._gdrive_index: Dict[str, Dict[str, Any]] = {}
+        self._gdrive_index_lock = threading.Lock()
+        self._gdrive_index_changed = False
 
         self._load_data()
 
+    @staticmethod
+    def _create_http_session() -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=32,
+                              max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]))
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"User-Agent": "Mozilla/5.0"})
+        return session
+
     def _load_settings_from_sheet(self) -> Dict[str, Any]:
         """Loads settings from the SETTINGS sheet."""
         settings_sheet_name = CONFIG["SHEETS"]["SETTINGS"]
         # Start with defaults
         current_settings = CONFIG["DEFAULT_SETTINGS"].copy()
         try:
-            settings_df = pd.read_excel(self.excel_file, sheet_name=settings_sheet_name)
+            settings_df = self._read_sheet(settings_sheet_name)
             loaded_settings = dict(zip(settings_df["Setting Name"], settings_df["Value"]))
             for key, value in loaded_settings.items():
                 if key in current_settings: # Only update known settings from default
@@ -379,9 +931,9 @@ class ExcelDataLoader:
             # Normalize specific settings
             current_settings[_SETTINGS_COLS["use_browser"]] = str(current_settings.get(_SETTINGS_COLS["use_browser"], "CHROME")).upper().strip()
             wd_ver_val = current_settings.get(_SETTINGS_COLS["wd_ver"])
-            current_settings[_SETTINGS_COLS["wd_ver"]] = normalize_value(wd_ver_val) if wd_ver_val and normalize_value(wd_ver_val) else None
+            current_settings[_SETTINGS_COLS["wd_ver"]] = (normalize_value(wd_ver_val) if wd_ver_val else "") or None
             custom_path_val = current_settings.get(_SETTINGS_COLS["custom_bsr_path"])
-            current_settings[_SETTINGS_COLS["custom_bsr_path"]] = normalize_value(custom_path_val) if custom_path_val and normalize_value(custom_path_val) else None
+            current_settings[_SETTINGS_COLS["custom_bsr_path"]] = (normalize_value(custom_path_val) if custom_path_val else "") or None
             
             log_system(f"{settings_sheet_name} sheet processed.")
         except Exception as e:
@@ -400,21 +952,15 @@ class ExcelDataLoader:
         browser_name_col = _BROWSER_COLS["name"]
         browser_path_cols = _BROWSER_COLS["paths"]
         try:
-            browser_df = pd.read_excel(self.excel_file, sheet_name=browser_sheet_name, dtype=str)
+            browser_df = self._read_sheet(browser_sheet_name, dtype=str)
             browser_df.dropna(subset=[browser_name_col], inplace=True)
             browser_df[browser_name_col] = browser_df[browser_name_col].str.upper().str.strip()
 
-            for _, row in browser_df.iterrows():
-                name = row[browser_name_col]
+            paths_by_row = collect_row_values(browser_df, browser_path_cols, lambda p: expand_path(str(p).strip()))
+            for row_idx, name in zip(browser_df.index, browser_df[browser_name_col]):
                 if not name: continue
 
-                paths = []
-                for col in browser_path_cols:
-                    if col in row and pd.notna(row[col]):
-                        raw_path = str(row[col]).strip()
-                        if raw_path:
-                            expanded_path = os.path.expandvars(raw_path)
-                            paths.append(expanded_path)
+                paths = paths_by_row.get(row_idx, [])
                 if paths:
                     browsers_map[name] = paths
                 else:
@@ -437,7 +983,7 @@ class ExcelDataLoader:
         placeholder_keyword_col = _PLACEHOLDER_COLS["keyword"]
         placeholder_header_col = _PLACEHOLDER_COLS["list_header"]
         try:
-            placeholder_df = pd.read_excel(self.excel_file, sheet_name=placeholder_sheet_name)
+            placeholder_df = self._read_sheet(placeholder_sheet_name)
             if placeholder_keyword_col not in placeholder_df.columns or \
                placeholder_header_col not in placeholder_df.columns:
                 log_system(f"Warning: '{placeholder_sheet_name}' sheet missing required columns ('{placeholder_keyword_col}', '{placeholder_header_col}'). Custom placeholders disabled.")
@@ -462,25 +1008,21 @@ class ExcelDataLoader:
         """Loads contacts from the LIST sheet, using custom placeholders for column setup."""
         contacts_df = pd.DataFrame()
         list_sheet_name = CONFIG["SHEETS"]["LIST"]
-        list_converters = {
-            _LIST_COLS["phone"]: str, _LIST_COLS["msg_code"]: str, _LIST_COLS["doc_code"]: str,
-            _LIST_COLS["media_code"]: str, _LIST_COLS["status"]: str,
-        }
-        # Add converters for columns used by custom placeholders
-        list_converters.update({header: str for header in custom_placeholders.values()})
 
         try:
-            loaded_df = pd.read_excel(self.excel_file, sheet_name=list_sheet_name, converters=list_converters)
+            # Text columns are normalized below, so the raw cell values can be used as-is.
+            # This is the only place LIST phones are normalized; everything downstream uses the column as loaded.
+            loaded_df = self._stream_sheet(list_sheet_name)
             for col in [_LIST_COLS["phone"], _LIST_COLS["msg_code"], _LIST_COLS["doc_code"], _LIST_COLS["media_code"]]:
                 if col in loaded_df.columns:
-                    loaded_df[col] = loaded_df[col].apply(normalize_value)
+                    loaded_df[col] = normalize_series(loaded_df[col])
                 else:
                     raise ValueError(f"Missing required column '{col}' in {list_sheet_name} sheet.")
 
             missing_custom_cols = []
             for list_header in custom_placeholders.values():
                 if list_header in loaded_df.columns:
-                    loaded_df[list_header] = loaded_df[list_header].apply(normalize_value)
+                    loaded_df[list_header] = normalize_series(loaded_df[list_header])
                 else:
                     missing_custom_cols.append(list_header)
             if missing_custom_cols:
@@ -493,6 +1035,14 @@ class ExcelDataLoader:
                 loaded_df[status_col] = pd.to_numeric(loaded_df[status_col], errors='coerce')
                 loaded_df[status_col] = loaded_df[status_col].fillna(_STATUS_VALS["PENDING"])
                 loaded_df[status_col] = loaded_df[status_col].astype(int)
+            # Only a handful of distinct statuses: the phase filters compare small category codes
+            loaded_df[status_col] = loaded_df[status_col].astype("category")
+
+            resolved_col = _LIST_COLS["resolved_name"]
+            if resolved_col in loaded_df.columns:
+                loaded_df[resolved_col] = normalize_series(loaded_df[resolved_col]).str.replace(r"\s+", " ", regex=True)
+            else:
+                loaded_df[resolved_col] = ""
             
             contacts_df = loaded_df
             log_system(f"'{list_sheet_name}' sheet loaded: {len(contacts_df)} contacts.")
@@ -501,6 +1051,43 @@ class ExcelDataLoader:
             # contacts_df remains an empty DataFrame initialized at the start of the method
         return contacts_df
 
+    def _read_sheet(self, sheet_name: str, **kwargs: Any) -> pd.DataFrame:
+        """pd.read_excel for one sheet, parsed from the workbook opened once in _load_data when available."""
+        if self._xls is None:
+            return pd.read_excel(self.excel_file, sheet_name=sheet_name, **kwargs)
+        with self._xls_lock: # One parse at a time: the shared workbook's zip handle isn't safe for concurrent parsing
+            return self._xls.parse(sheet_name, **kwargs)
+
+    @staticmethod
+    def _sheet_records(ws: Any) -> Tuple[List[Any], List[Tuple[Any, ...]]]:
+        ws.reset_dimensions() # The stored dimension can be stale; rows may then be ragged
+        rows = ws.iter_rows(values_only=True)
+        header_row = next(rows, ())
+        while header_row and header_row[-1] is None:
+            header_row = header_row[:-1]
+        headers = [header if header is not None else f"Unnamed: {i}" for i, header in enumerate(header_row)]
+        width = len(headers)
+        return headers, [tuple(row[:width]) + (None,) * (width - len(row)) for row in rows]
+
+    def _stream_sheet(self, sheet_name: str) -> pd.DataFrame:
+        """
+        Reads a sheet row by row with openpyxl in read-only mode (no styles or full workbook tree in memory).
+        Blank rows inside the data are kept, so DataFrame row i is always Excel row i + 2.
+        """
+        if self._xls is not None:
+            # Reuse the read-only workbook already opened by the shared ExcelFile
+            with self._xls_lock:
+                headers, records = self._sheet_records(self._xls.book[sheet_name])
+        else:
+            wb = load_workbook(self.excel_file, read_only=True, data_only=True)
+            try:
+                headers, records = self._sheet_records(wb[sheet_name])
+            finally:
+                wb.close()
+        while records and all(value is None for value in records[-1]):
+            records.pop() # Trailing empty rows
+        return pd.DataFrame.from_records(records, columns=headers)
+
     def _load_messages_from_sheet(self) -> Dict[str, str]:
         """Loads messages from the MSGS sheet."""
         messages_map: Dict[str, str] = {}
@@ -508,11 +1095,12 @@ class ExcelDataLoader:
         msgs_code_col = CONFIG["COLUMNS"]["MSGS"]["msg_code"]
         msgs_msg_col = CONFIG["COLUMNS"]["MSGS"]["message"]
         try:
-            msgs_df = pd.read_excel(self.excel_file, sheet_name=msgs_sheet_name, converters={msgs_code_col: str})
-            msgs_df[msgs_code_col] = msgs_df[msgs_code_col].apply(normalize_value)
+            msgs_df = self._read_sheet(msgs_sheet_name, converters={msgs_code_col: str})
+            msgs_df[msgs_code_col] = normalize_series(msgs_df[msgs_code_col])
             # Ensure message column is treated as string, even if it contains numbers that pandas might auto-convert
-            msgs_df[msgs_msg_col] = msgs_df[msgs_msg_col].astype(str) 
-            messages_map = dict(zip(msgs_df[msgs_code_col], msgs_df[msgs_msg_col]))
+            msgs_df[msgs_msg_col] = msgs_df[msgs_msg_col].fillna("").astype(str)
+            # Templates are stored URL-encoded; decode once here instead of once per contact
+            messages_map = {code: urllib.parse.unquote_plus(msg) for code, msg in zip(msgs_df[msgs_code_col], msgs_df[msgs_msg_col])}
             log_system(f"'{msgs_sheet_name}' sheet loaded: {len(messages_map)} messages.")
         except Exception as e:
             log_system(f"Warning: Could not load '{msgs_sheet_name}' sheet: {e}. Message functionality may be affected.")
@@ -525,45 +1113,57 @@ class ExcelDataLoader:
         file_cols = col_config["files"]
         
         try:
-            df = pd.read_excel(self.excel_file, sheet_name=sheet_name, converters={code_col: str})
-            df[code_col] = df[code_col].apply(normalize_value)
+            df = self._read_sheet(sheet_name, converters={code_col: str})
+            df[code_col] = normalize_series(df[code_col])
             df.dropna(subset=[code_col], inplace=True)
 
-            for _, row in df.iterrows():
-                key = row[code_col]
+            entries_by_row = collect_row_values(df, file_cols, normalize_value)
+            search_gdrive_url = _GDRIVE_URL_RE.search
+            # Fetch every Google Drive link of the sheet up front, concurrently
+            gdrive_jobs: Dict[str, str] = {}
+            for row_idx, key in zip(df.index, df[code_col]):
+                if key and key != '0':
+                    for p in entries_by_row.get(row_idx, []):
+                        if search_gdrive_url(p) is not None:
+                            gdrive_jobs.setdefault(p, key)
+            downloads = self._download_many_gdrive(gdrive_jobs) if gdrive_jobs else {}
+            # Check every local path of the sheet with one directory listing per folder
+            local_paths = classify_paths([
+                expand_path(p) for values in entries_by_row.values() for p in values
+                if p and search_gdrive_url(p) is None
+            ])
+            for row_idx, key in zip(df.index, df[code_col]):
                 if not key or key == '0':
                     continue
 
-                raw_file_entries = [row.get(f_col) for f_col in file_cols if f_col in row and pd.notna(row.get(f_col))]
-                
                 valid_paths = []
                 invalid_files_found = []
 
-                for p_entry in raw_file_entries:
-                    p = normalize_value(p_entry)
+                for p in entries_by_row.get(row_idx, []):
                     if p:
-                        is_gdrive_link = "drive.google.com/" in p.lower() and \
-                                        ("file/d/" in p.lower() or "/uc?" in p.lower() or "/open?" in p.lower() or "view?id=" in p.lower())
+                        is_gdrive_link = search_gdrive_url(p) is not None
 
                         if is_gdrive_link:
-                            log_system(f"Detected Google Drive link for code '{key}': {p}. Attempting download...")
-                            
-                            downloaded_path = self._download_gdrive_with_proper_naming(p, key)
-                            
-                            if downloaded_path and Path(downloaded_path).exists():
+                            downloaded_path = downloads.get(p)
+                            if downloaded_path and is_regular_file(downloaded_path):
                                 log_system(f"Successfully downloaded '{Path(downloaded_path).name}' for code '{key}': {downloaded_path}")
-                                valid_paths.append(downloaded_path)
+                                resolved_path = str(Path(downloaded_path).resolve())
+                                if resolved_path not in valid_paths:
+                                    valid_paths.append(resolved_path)
                             else:
                                 log_system(f"Failed to download Google Drive file for code '{key}': {p}")
                                 invalid_files_found.append(f"{p} (Download failed)")
                         
-                        elif Path(p).exists() and Path(p).is_file():
-                            valid_paths.append(str(Path(p).resolve()))
-                        elif Path(p).exists() and not Path(p).is_file():
-                            log_system(f"Warning: Path exists but is not a file for code '{key}': {p}")
-                            invalid_files_found.append(f"{p} (Not a file)")
                         else:
-                            invalid_files_found.append(f"{p} (Local file not found)")
+                            path_kind, resolved_path = local_paths[expand_path(p)]
+                            if path_kind == "file":
+                                if resolved_path not in valid_paths:
+                                    valid_paths.append(resolved_path)
+                            elif path_kind != "missing":
+                                log_system(f"Warning: Path exists but is not a file for code '{key}': {p}")
+                                invalid_files_found.append(f"{p} (Not a file)")
+                            else:
+                                invalid_files_found.append(f"{p} (Local file not found)")
                 
                 if invalid_files_found:
                     log_system(f"Warning: For code '{key}' in {sheet_name}, some files were problematic: {', '.join(invalid_files_found)}")
@@ -582,18 +1182,155 @@ class ExcelDataLoader:
         
         return mapping
 
+    def _download_many_gdrive(self, jobs: Dict[str, str]) -> Dict[str, Optional[str]]:
+        """
+        Downloads {url: code} Google Drive links concurrently (one download per Drive file ID) over the shared
+        session and returns {url: local path or None}.
+        """
+        urls_by_file_id: Dict[str, List[str]] = {}
+        results: Dict[str, Optional[str]] = {}
+        for url in jobs:
+            file_id = self._extract_gdrive_file_id(url)
+            if file_id:
+                urls_by_file_id.setdefault(file_id, []).append(url)
+            else:
+                log_system(f"Could not extract file ID from URL: {url}")
+                results[url] = None
+        if not urls_by_file_id:
+            return results
+
+        log_system(f"Fetching {len(urls_by_file_id)} Google Drive file(s)...")
+        self._gdrive_index = self._read_gdrive_index()
+        self._gdrive_index_changed = False
+        max_workers = min(_GDRIVE_DOWNLOAD_WORKERS, len(urls_by_file_id))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="GDriveDownload") as pool:
+            futures = {pool.submit(self._download_gdrive_with_proper_naming, urls[0], jobs[urls[0]]): urls
+                       for urls in urls_by_file_id.values()}
+            for future in as_completed(futures):
+                urls = futures[future]
+                try:
+                    downloaded_path = future.result()
+                except Exception as e:
+                    log_system(f"Failed to download Google Drive file {urls[0]}: {e}")
+                    downloaded_path = None
+                for url in urls:
+                    results[url] = downloaded_path
+        if self._gdrive_index_changed:
+            self._write_gdrive_index()
+        return results
+
+    def _read_gdrive_index(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.gdrive_download_cache / _GDRIVE_INDEX_FILE, encoding="utf-8") as f:
+                index = json.load(f)
+            return index if isinstance(index, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            log_system(f"Warning: Ignoring unreadable Google Drive cache index: {e}")
+            return {}
+
+    def _write_gdrive_index(self) -> None:
+        """Writes the index to a temp file and swaps it in, so a crash never leaves a truncated index."""
+        index_path = self.gdrive_download_cache / _GDRIVE_INDEX_FILE
+        tmp_path = index_path.with_name(f"{_GDRIVE_INDEX_FILE}.{os.getpid()}.tmp")
+        try:
+            with self._gdrive_index_lock:
+                data = json.dumps(self._gdrive_index)
+            tmp_path.write_text(data, encoding="utf-8")
+            os.replace(tmp_path, index_path)
+        except OSError as e:
+            log_system(f"Warning: Could not save Google Drive cache index: {e}")
+
+    def _indexed_gdrive_file(self, file_id: str) -> Optional[str]:
+        """Path of an indexed download that is still on disk with its recorded size, else None."""
+        with self._gdrive_index_lock:
+            entry = self._gdrive_index.get(file_id)
+        if not entry:
+            return None
+        try:
+            st = os.stat(entry["path"])
+        except (OSError, KeyError, TypeError):
+            return None
+        if stat.S_ISREG(st.st_mode) and st.st_size == entry.get("size"):
+            return entry["path"]
+        return None
+
+    def _record_gdrive_file(self, file_id: str, path: str) -> None:
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            return
+        with self._gdrive_index_lock:
+            self._gdrive_index[file_id] = {"path": path, "size": size}
+            self._gdrive_index_changed = True
+
+    def _gdrive_file_current(self, file_id: str, path: str) -> bool:
+        """
+        Whether a cached download still matches the file on Drive. One ranged GET on the uc endpoint reads the
+        file's current size without downloading it; if Drive doesn't say (e.g. the large-file warning page, or
+        no network), the cached copy is kept.
+        """
+        try:
+            local_size = os.path.getsize(path)
+        except OSError:
+            return False
+        try:
+            response = self._http.get(f"https://drive.google.com/uc?id={file_id}&export=download",
+                                      headers={"Range": "bytes=0-0"}, stream=True, timeout=10)
+            try:
+                if response.status_code == 206:
+                    remote_size = int(response.headers.get("Content-Range", "").rpartition("/")[2])
+                elif response.status_code == 200 and not response.headers.get("Content-Type", "").startswith("text/html") \
+                        and "Content-Encoding" not in response.headers:
+                    remote_size = int(response.headers["Content-Length"])
+                else:
+                    return True
+            finally:
+                response.close()
+        except (requests.RequestException, KeyError, ValueError):
+            return True
+        return remote_size == local_size
+
+    def _discard_stale_gdrive_file(self, code: str, path: str) -> None:
+        log_system(f"Google Drive file for code '{code}' changed on Drive; downloading it again.")
+        try: os.remove(path)
+        except OSError as e: log_system(f"Warning: Could not remove outdated download '{path}': {e}")
+
     def _download_gdrive_with_proper_naming(self, url: str, code: str) -> str:
         """Download Google Drive file and ensure proper naming with extension"""
-        cache_dir = Path(self.gdrive_download_cache)
-        cache_dir.mkdir(exist_ok=True)
-        
-        # Clean up any existing .part files first
-        self._cleanup_partial_downloads()
-        
         file_id = self._extract_gdrive_file_id(url)
         if not file_id:
             log_system(f"Could not extract file ID from URL: {url}")
             return None
+
+        # Indexed from an earlier run: one stat and a size check against Drive instead of a folder scan
+        indexed_path = self._indexed_gdrive_file(file_id)
+        if indexed_path:
+            if self._gdrive_file_current(file_id, indexed_path):
+                log_system(f"Using cached Google Drive file for code '{code}': {indexed_path}")
+                return indexed_path
+            self._discard_stale_gdrive_file(code, indexed_path)
+
+        downloaded_path = self._fetch_gdrive_file(file_id, code)
+        if downloaded_path:
+            self._record_gdrive_file(file_id, downloaded_path)
+        return downloaded_path
+
+    def _fetch_gdrive_file(self, file_id: str, code: str) -> Optional[str]:
+        cache_dir = Path(self.gdrive_download_cache) / file_id
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Reuse a previous complete download of this file while Drive still reports the same size
+        cached_path = self._find_cached_gdrive_file(cache_dir)
+        if cached_path:
+            if self._gdrive_file_current(file_id, cached_path):
+                log_system(f"Using cached Google Drive file for code '{code}': {cached_path}")
+                return cached_path
+            self._discard_stale_gdrive_file(code, cached_path)
+
+        # Clean up any existing .part files first
+        self._cleanup_partial_downloads(cache_dir)
         
         # First, try to get file metadata to determine the proper filename and extension
         proper_filename, content_type = self._get_gdrive_file_metadata(file_id, code)
@@ -609,7 +1346,7 @@ class ExcelDataLoader:
             )
             
             # Check if gdown succeeded
-            if downloaded_path and Path(downloaded_path).exists() and not downloaded_path.endswith('.part'):
+            if downloaded_path and not downloaded_path.endswith('.part') and is_regular_file(downloaded_path):
                 # If gdown worked perfectly, just rename if needed
                 final_path = self._ensure_proper_filename(downloaded_path, proper_filename, content_type, code)
                 return final_path
@@ -618,12 +1355,12 @@ class ExcelDataLoader:
             log_system(f"gdown failed: {e}")
         
         # Handle .part files or failed downloads
-        part_files = list(cache_dir.glob("*.part"))
+        part_files = self._part_file_entries(cache_dir)
         if part_files:
             log_system(f"Found {len(part_files)} .part files, processing...")
             
             # Get the largest .part file (most likely the one we want)
-            largest_part = max(part_files, key=lambda f: f.stat().st_size)
+            largest_part = max(part_files, key=lambda entry: entry.stat().st_size)
             
             if largest_part.stat().st_size > 100:  # At least 100 bytes
                 # Rename .part file to proper name with extension
@@ -631,13 +1368,15 @@ class ExcelDataLoader:
                 final_path = cache_dir / final_filename
                 
                 try:
-                    shutil.move(str(largest_part), str(final_path))
+                    if largest_part.name != final_filename:
+                        replace_file(largest_part.path, final_path)
                     log_system(f"Successfully processed .part file to: {final_path}")
                     
                     # Clean up any remaining .part files
                     for part_file in part_files:
-                        if part_file.exists():
-                            part_file.unlink()
+                        if part_file.path != largest_part.path:
+                            try: os.unlink(part_file.path)
+                            except FileNotFoundError: pass
                     
                     return str(final_path)
                     
@@ -650,25 +1389,21 @@ class ExcelDataLoader:
 
     def _get_gdrive_file_metadata(self, file_id: str, code: str) -> tuple:
         """Get file metadata from Google Drive to determine proper filename and type"""
+        api_metadata = self._get_gdrive_api_metadata(file_id)
+        if api_metadata:
+            return api_metadata
         try:
             # Try to get file info from Google Drive API without authentication
             metadata_url = f"https://drive.google.com/file/d/{file_id}/view"
             
-            response = requests.get(metadata_url, timeout=10)
+            response = self._http.get(metadata_url, timeout=10)
             if response.status_code == 200:
                 # Try to extract filename from page content
                 content = response.text
                 
                 # Look for filename in various places
-                filename_patterns = [
-                    r'"title":"([^"]+)"',
-                    r'<title>([^<]+) - Google Drive</title>',
-                    r'"filename":"([^"]+)"',
-                    r'data-filename="([^"]+)"'
-                ]
-                
-                for pattern in filename_patterns:
-                    match = re.search(pattern, content)
+                for pattern in _GDRIVE_FILENAME_RES:
+                    match = pattern.search(content)
                     if match:
                         filename = match.group(1).strip()
                         if filename and filename != "Untitled":
@@ -689,59 +1424,96 @@ class ExcelDataLoader:
         # Default fallback
         return f"{code}_{file_id}", None
 
+    def _get_gdrive_api_metadata(self, file_id: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Small JSON lookup of name and mimeType via the Drive Files API; None if no API key is set or it fails."""
+        cached = _gdrive_metadata_cache.get(file_id)
+        if cached:
+            return cached
+        api_key = self.settings.get(_SETTINGS_COLS["gdrive_api_key"])
+        if not api_key:
+            return None
+        try:
+            response = self._http.get(
+                _GDRIVE_FILES_API_URL.format(file_id=file_id),
+                params={"fields": "name,mimeType", "key": api_key},
+                timeout=5,
+            )
+            if response.ok:
+                data = response.json()
+                name = (data.get("name") or "").strip()
+                if name:
+                    log_system(f"Detected filename from Drive API: {name}")
+                    metadata = (name, data.get("mimeType"))
+                    _gdrive_metadata_cache[file_id] = metadata
+                    return metadata
+            else:
+                log_system(f"Drive API metadata lookup for {file_id} failed ({response.status_code}), falling back to page scrape.")
+        except Exception as e:
+            log_system(f"Drive API metadata lookup for {file_id} failed: {e}")
+        return None
+
     def _direct_download_gdrive(self, file_id: str, code: str, filename: str = None, content_type: str = None) -> str:
         """Direct download using requests as fallback"""
-        cache_dir = Path(self.gdrive_download_cache)
+        cache_dir = Path(self.gdrive_download_cache) / file_id
         
         try:
             download_url = f"https://drive.google.com/uc?id={file_id}&export=download"
             
-            with requests.Session() as session:
-                response = session.get(download_url, stream=True, timeout=30)
+            session = self._http
+            response = session.get(download_url, stream=True, timeout=_GDRIVE_DOWNLOAD_TIMEOUT)
+            
+            # Handle virus scan warning for large files. Only an HTML page can be the warning, and reading .text
+            # consumes the streamed body, so a binary response is never read here
+            body_read = response.status_code == 200 and response.headers.get('content-type', '').lower().startswith('text/html')
+            if body_read and 'virus scan warning' in response.text.lower():
+                # Extract confirm token
+                confirm_token = None
+                for key, value in response.cookies.items():
+                    if key.startswith('download_warning'):
+                        confirm_token = value
+                        break
                 
-                # Handle virus scan warning for large files
-                if response.status_code == 200 and 'virus scan warning' in response.text.lower():
-                    # Extract confirm token
-                    confirm_token = None
-                    for key, value in response.cookies.items():
-                        if key.startswith('download_warning'):
-                            confirm_token = value
-                            break
-                    
-                    if confirm_token:
-                        params = {'id': file_id, 'confirm': confirm_token}
-                        response = session.get(download_url, params=params, stream=True, timeout=30)
+                if confirm_token:
+                    params = {'id': file_id, 'confirm': confirm_token}
+                    response = session.get(download_url, params=params, stream=True, timeout=_GDRIVE_DOWNLOAD_TIMEOUT)
+                    body_read = False
+            
+            if response.status_code == 200:
+                # Determine filename
+                final_filename = filename or f"{code}_{file_id}"
+                
+                # Try to get filename from headers
+                if 'content-disposition' in response.headers:
+                    cd = response.headers['content-disposition']
+                    if 'filename=' in cd:
+                        header_filename = cd.split('filename=')[1].strip('"\'')
+                        if header_filename:
+                            final_filename = header_filename
+                
+                # Ensure extension based on content type
+                if not Path(final_filename).suffix and content_type:
+                    ext = extension_for_mime(content_type)
+                    if ext:
+                        final_filename += ext
+                
+                file_path = cache_dir / final_filename
+                part_path = cache_dir / f"{final_filename}.part"
+                
+                # Download to a .part file so an interrupted download is never picked up from the cache
+                with open(part_path, 'wb') as f:
+                    if body_read: # Already read by the warning check; write what was read
+                        f.write(response.content)
+                    else:
+                        response.raw.decode_content = True # Undo gzip/deflate transfer encoding while copying
+                        shutil.copyfileobj(response.raw, f, length=1 << 20)
+                if not regular_file_size(part_path):
+                    log_system(f"Direct download for {file_id} returned no data.")
+                    os.remove(part_path) # An empty file must not be cached as the attachment
+                    return None
+                os.replace(part_path, file_path)
+                log_system(f"Direct download successful: {file_path}")
+                return str(file_path)
                 
-                if response.status_code == 200:
-                    # Determine filename
-                    final_filename = filename or f"{code}_{file_id}"
-                    
-                    # Try to get filename from headers
-                    if 'content-disposition' in response.headers:
-                        cd = response.headers['content-disposition']
-                        if 'filename=' in cd:
-                            header_filename = cd.split('filename=')[1].strip('"\'')
-                            if header_filename:
-                                final_filename = header_filename
-                    
-                    # Ensure extension based on content type
-                    if not Path(final_filename).suffix and content_type:
-                        ext = mimetypes.guess_extension(content_type)
-                        if ext:
-                            final_filename += ext
-                    
-                    file_path = cache_dir / final_filename
-                    
-                    # Download file
-                    with open(file_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
-                            if chunk:
-                                f.write(chunk)
-                    
-                    if file_path.exists() and file_path.stat().st_size > 0:
-                        log_system(f"Direct download successful: {file_path}")
-                        return str(file_path)
-                    
         except Exception as e:
             log_system(f"Direct download failed for {file_id}: {e}")
         
@@ -751,8 +1523,10 @@ class ExcelDataLoader:
         """Ensure the downloaded file has the proper name and extension"""
         current_path = Path(file_path)
         
-        if not current_path.exists():
+        if not is_regular_file(current_path):
             return file_path
+        if desired_filename and current_path.name == desired_filename:
+            return file_path # Already named correctly, nothing to rename
         
         # If we have a desired filename, use it
         if desired_filename:
@@ -771,7 +1545,7 @@ class ExcelDataLoader:
         # Rename if needed
         if new_path != current_path:
             try:
-                shutil.move(str(current_path), str(new_path))
+                replace_file(current_path, new_path)
                 log_system(f"Renamed file to: {new_path}")
                 return str(new_path)
             except Exception as e:
@@ -783,7 +1557,7 @@ class ExcelDataLoader:
     def _detect_file_extension(self, file_path: Path, content_type: str = None) -> str:
         """Detect file extension based on content"""
         if content_type:
-            ext = mimetypes.guess_extension(content_type)
+            ext = extension_for_mime(content_type)
             if ext:
                 return ext
         
@@ -792,18 +1566,13 @@ class ExcelDataLoader:
             with open(file_path, 'rb') as f:
                 header = f.read(32)
             
-            # Common file signatures
-            if header.startswith(b'%PDF'):
-                return '.pdf'
-            elif header.startswith(b'\xff\xd8\xff'):
-                return '.jpg'
-            elif header.startswith(b'\x89PNG'):
-                return '.png'
-            elif header.startswith(b'GIF8'):
-                return '.gif'
-            elif header.startswith(b'PK'):
-                return '.zip'  # Could also be docx, xlsx, etc.
-            elif b'<html' in header.lower() or b'<!doctype' in header.lower():
+            # Common file signatures, longest prefix first
+            for prefix_len in _MAGIC_PREFIX_LENS:
+                ext = _MAGIC_EXTENSIONS.get(header[:prefix_len])
+                if ext:
+                    return ext
+            lowered = header.lower()
+            if b'<html' in lowered or b'<!doctype' in lowered:
                 return '.html'
             
         except Exception as e:
@@ -813,31 +1582,33 @@ class ExcelDataLoader:
 
     def _extract_gdrive_file_id(self, url: str) -> str:
         """Extract Google Drive file ID from URL"""
-        patterns = [
-            r'/file/d/([a-zA-Z0-9-_]+)',
-            r'id=([a-zA-Z0-9-_]+)',
-            r'/uc\?id=([a-zA-Z0-9-_]+)',
-            r'/open\?id=([a-zA-Z0-9-_]+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-        
+        match = _GDRIVE_ID_RE.search(url)
+        return match.group(1) if match else None
+
+    @staticmethod
+    def _find_cached_gdrive_file(cache_dir: Path) -> Optional[str]:
+        """Returns a completed download in a file ID's cache folder, if any."""
+        for cached_file in sorted(cache_dir.iterdir()):
+            if cached_file.suffix != ".part" and regular_file_size(cached_file):
+                return str(cached_file)
         return None
 
-    def _cleanup_partial_downloads(self):
+    @staticmethod
+    def _part_file_entries(cache_dir: Path) -> List[os.DirEntry]:
+        """Lists .part files with a single directory read; DirEntry.stat() reuses the readdir data where possible."""
+        with os.scandir(cache_dir) as entries:
+            return [entry for entry in entries if entry.name.endswith(".part") and entry.is_file()]
+
+    def _cleanup_partial_downloads(self, cache_dir: Path):
         """Clean up any existing .part files from previous failed downloads"""
         try:
-            cache_dir = Path(self.gdrive_download_cache)
-            part_files = list(cache_dir.glob("*.part"))
+            part_files = self._part_file_entries(cache_dir)
             for part_file in part_files:
                 try:
-                    part_file.unlink()
-                    log_system(f"Cleaned up partial download: {part_file}")
+                    os.unlink(part_file.path)
+                    log_system(f"Cleaned up partial download: {part_file.path}")
                 except Exception as e:
-                    log_system(f"Warning: Could not remove partial file {part_file}: {e}")
+                    log_system(f"Warning: Could not remove partial file {part_file.path}: {e}")
             
             if part_files:
                 log_system(f"Cleaned up {len(part_files)} partial download files")
@@ -846,16 +1617,25 @@ class ExcelDataLoader:
             log_system(f"Warning: Error during cleanup of partial downloads: {e}")
 
     def _load_data(self) -> None:
-        """Loads all data from the Excel file by calling helper methods."""
+        """
+        Loads all data from the Excel file by calling helper methods. Sheets are parsed one after another from one
+        workbook handle; only DOCS and MEDIA run in the background, so their Google Drive downloads overlap the rest.
+        """
         try:
+            # Open and unzip the workbook once; every sheet loader parses from this handle
+            self._xls = pd.ExcelFile(self.excel_file, engine="openpyxl")
             self.settings = self._load_settings_from_sheet()
-            self.browsers_map = self._load_browsers_from_sheet()
-            self.custom_placeholders = self._load_placeholders_from_sheet()
-            # Pass custom_placeholders to _load_contacts_from_sheet as it needs them
-            self.contacts_df = self._load_contacts_from_sheet(self.custom_placeholders)
-            self.messages_map = self._load_messages_from_sheet()
-            self.docs_map = self._load_file_mapping("DOCS", CONFIG["COLUMNS"]["DOCS"])
-            self.media_map = self._load_file_mapping("MEDIA", CONFIG["COLUMNS"]["MEDIA"])
+            # DOCS and MEDIA need GDRIVE_API_KEY from settings and share the Google Drive download cache,
+            # so they start once settings are in and run one after the other
+            with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ExcelLoad") as pool:
+                files_future = pool.submit(self._load_docs_and_media)
+                self.browsers_map = self._load_browsers_from_sheet()
+                # LIST needs the custom placeholders for its column setup, so it runs after PLACEHOLDER
+                self.custom_placeholders, self.contacts_df = self._load_placeholders_and_contacts()
+                self.phone_to_row_idx = self._build_phone_row_index(self.contacts_df)
+                self.messages_map = self._load_messages_from_sheet()
+                self.docs_map, self.media_map = files_future.result()
+            self._render_messages()
 
         except Exception as e:
             logging.exception(f"Critical error during the overall data loading process: {e}")
@@ -867,12 +1647,50 @@ class ExcelDataLoader:
             self.media_map = {}
             self.custom_placeholders = {}
             self.browsers_map = {}
+            self.phone_to_row_idx = {}
             log_system("ExcelDataLoader: Falling back to default/empty values due to critical loading error.")
+        finally:
+            self._http.close() # Downloads only happen while loading
+            if self._xls is not None:
+                self._xls.close()
+                self._xls = None
+
+    def _render_messages(self) -> None:
+        """Pre-renders the encoded message of every PENDING/RETRY contact, one vectorized pass per message code."""
+        contacts_df = self.contacts_df
+        if contacts_df is None or contacts_df.empty:
+            return
+        rendered_col, msg_code_col = _LIST_COLS["rendered_message"], _LIST_COLS["msg_code"]
+        contacts_df[rendered_col] = ""
+        to_send = contacts_df[_LIST_COLS["status"]].isin([_STATUS_VALS["PENDING"], _STATUS_VALS["RETRY"]])
+        for msg_code, group in contacts_df[to_send].groupby(msg_code_col, sort=False):
+            decoded_template = self.messages_map.get(msg_code) if msg_code != "0" else None
+            if decoded_template:
+                contacts_df.loc[group.index, rendered_col] = render_messages(decoded_template, group, self.custom_placeholders)
+
+    def _load_placeholders_and_contacts(self) -> Tuple[Dict[str, str], pd.DataFrame]:
+        custom_placeholders = self._load_placeholders_from_sheet()
+        return custom_placeholders, self._load_contacts_from_sheet(custom_placeholders)
+
+    def _load_docs_and_media(self) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        docs_map = self._load_file_mapping("DOCS", CONFIG["COLUMNS"]["DOCS"])
+        return docs_map, self._load_file_mapping("MEDIA", CONFIG["COLUMNS"]["MEDIA"])
+
+    @staticmethod
+    def _build_phone_row_index(contacts_df: pd.DataFrame) -> Dict[str, List[int]]:
+        """Maps each phone to its Excel row number(s) in the LIST sheet (row 1 is the header)."""
+        phone_col = _LIST_COLS["phone"]
+        if contacts_df.empty or phone_col not in contacts_df.columns:
+            return {}
+        index: Dict[str, List[int]] = {}
+        for i, phone in enumerate(contacts_df[phone_col].tolist()):
+            if phone:
+                index.setdefault(phone, []).append(i + 2)
+        return index
 
     def _resolve_name(self, row: pd.Series) -> str:
-        name_col = "_ResolvedName"
-        raw_name = normalize_value(row.get(name_col, ""))
-        return raw_name
+        # Normalized for the whole column in _load_contacts_from_sheet
+        return row.get(_LIST_COLS["resolved_name"], "")
 
     # --- Public Accessors ---
     def get_settings(self) -> Dict[str, Any]: return self.settings
@@ -882,23 +1700,135 @@ class ExcelDataLoader:
     def get_media_map(self) -> Dict[str, List[str]]: return self.media_map
     def get_custom_placeholders(self) -> Dict[str, str]: return self.custom_placeholders
     def get_browsers_map(self) -> Dict[str, List[str]]: return self.browsers_map
+    def get_phone_row_index(self) -> Dict[str, List[int]]: return self.phone_to_row_idx
+    def get_status_workbook(self) -> StatusWorkbook: return self.status_workbook
 
 # --- Browser Manager ---
+# Launch flags shared by every Chromium-based instance; per-instance flags are added in setup_browser
+_STATIC_CHROME_ARGS: Final = (
+    "--disable-extensions",
+    "--disable-default-apps",
+    "--disable-popup-blocking",
+    "--no-first-run",
+    "--no-service-autorun",
+    "--password-store=basic",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-blink-features=AutomationControlled",
+    # Pool instances share the screen, so most are occluded or in the background; keep their timers running
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-features=Translate,MediaRouter",
+    "--disable-sync",
+)
+# Headless runs are send-only: skip avatars, stickers and thumbnails. This is a launch flag rather than a content
+# setting pref, so it isn't saved into the profile and visible runs still show images.
+_HEADLESS_CHROME_ARGS: Final = ("--headless=new", "--window-size=1920,1080", "--blink-settings=imagesEnabled=false")
+_CHROME_EXPERIMENTAL_OPTIONS: Final = (
+    ("excludeSwitches", ["enable-automation", "enable-logging"]),
+    ("useAutomationExtension", False),
+    ("prefs", {"profile.default_content_setting_values.notifications": 2}),
+)
+
+_ALIVE_TTL_S: Final = 2.0 # A browser that answered a liveness ping this recently is assumed to be up
+
+_BROWSER_CLOSE_WAIT_S: Final = 5.0 # How long a closed leftover browser gets to release its profile
+
+def running_browser_info(user_data_path: Any) -> Optional[Dict[str, Any]]:
+    """
+    /json/version (plus "port") of a browser still running on this profile (e.g. left over by a crash), else None.
+    The profile's DevToolsActivePort file names the port and browser id the browser on it serves; whatever answers
+    on that port only counts if its id matches, so another program's browser on the port is never taken over.
+    """
+    try:
+        port, browser_path = (Path(user_data_path) / "DevToolsActivePort").read_text(encoding="utf-8").split()[:2]
+        response = requests.get(f"http://127.0.0.1:{int(port)}/json/version", timeout=0.3)
+        response.raise_for_status()
+        info = response.json()
+    except (OSError, ValueError, requests.RequestException):
+        return None
+    if not str(info.get("webSocketDebuggerUrl", "")).endswith(browser_path):
+        return None
+    info["port"] = int(port)
+    return info
+
+def close_running_browser(info: Dict[str, Any], user_data_path: Any) -> bool:
+    """Closes a browser found by running_browser_info over its DevTools socket; True once it has exited."""
+    try:
+        ws = websocket.create_connection(info["webSocketDebuggerUrl"], timeout=2, suppress_origin=True)
+        try:
+            ws.send(json.dumps({"id": 1, "method": "Browser.close"}))
+            ws.recv()
+        finally:
+            ws.close()
+    except (websocket.WebSocketException, OSError):
+        pass # The socket drops as the browser closes
+    deadline = time.monotonic() + _BROWSER_CLOSE_WAIT_S
+    while running_browser_info(user_data_path):
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.2)
+    return True
+
+def port_in_use(port: int) -> bool:
+    """True if something on this machine already listens on the local TCP port."""
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.3):
+            return True
+    except OSError:
+        return False
+
 class BrowserManager:
     def __init__(self, instance_id: int) -> None:
         self.driver: Optional[WebDriver] = None
         self.instance_id = instance_id
         self.user_data_path = get_persistent_temp_path(str(instance_id))
         self.browser_type: Optional[str] = None
-
-    def get_latest_version():
-        url = "https://googlechromelabs.github.io/chrome-for-testing/"
-        response = requests.get(url)
-        response.raise_for_status()
-        tree = html.fromstring(response.content)
-        xpath = "/html/body/div/table/tbody/tr[1]/td[1]/code"
-        elements = tree.xpath(xpath)
-        return elements[0].text()
+        self.headless: Optional[bool] = None
+        self.pacer = HumanPacer(instance_id)
+        self.send_locators: Optional["SendLocators"] = None
+        self._alive_checked_at = 0.0 # monotonic time of the last successful liveness ping
+        self.debugging_port = 9222 + instance_id
+        self.attached = False # True if the driver attached to an already running browser instead of launching one
+
+    def is_alive(self) -> bool:
+        """Pings the browser (window_handles), trusting a successful ping for _ALIVE_TTL_S seconds."""
+        if self.driver is None:
+            return False
+        now = time.monotonic()
+        if now - self._alive_checked_at < _ALIVE_TTL_S:
+            return True
+        try:
+            alive = len(self.driver.window_handles) > 0
+        except WebDriverException:
+            alive = False
+        self._alive_checked_at = now if alive else 0.0
+        return alive
+
+    def prepare_locators(self, settings: Dict[str, Any]) -> "SendLocators":
+        """Builds the send-path locators from this run's settings once, instead of per message."""
+        self.send_locators = build_send_locators(settings)
+        return self.send_locators
+
+    # (browser name, candidate paths) -> executable found there. Misses are not cached, so a browser installed
+    # (or a BROWSER sheet path fixed) while the app is running is found on the next start
+    _browser_paths: Dict[Tuple[str, Tuple[str, ...]], str] = {}
+
+    @staticmethod
+    def _resolve_browser_path(browser_name_upper: str, possible_paths: Tuple[str, ...]) -> Optional[str]:
+        """First existing executable among possible_paths; cached so every instance doesn't re-stat the same list."""
+        cached = BrowserManager._browser_paths.get((browser_name_upper, possible_paths))
+        if cached:
+            return cached
+        log_system(f"Searching for {browser_name_upper} executable in: {list(possible_paths)}")
+        for path_str in possible_paths:
+            path = Path(path_str)
+            if is_regular_file(path):
+                log_system(f"Found {browser_name_upper} executable at: {path}")
+                BrowserManager._browser_paths[(browser_name_upper, possible_paths)] = str(path)
+                return str(path)
+        return None
 
     def _find_browser_executable(self, browser_name: str, browsers_map: Dict[str, List[str]]) -> Optional[str]:
         """Finds the first valid executable path for the given browser name."""
@@ -907,16 +1837,10 @@ class BrowserManager:
             log_system(f"Error: Browser '{browser_name}' not defined in BROWSER sheet.")
             return None
 
-        possible_paths = browsers_map[browser_name_upper]
-        log_system(f"Searching for {browser_name_upper} executable in: {possible_paths}")
-        for path_str in possible_paths:
-            path = Path(path_str)
-            if path.exists() and path.is_file():
-                log_system(f"Found {browser_name_upper} executable at: {path}")
-                return str(path)
-
-        log_system(f"Error: Could not find a valid executable for {browser_name_upper} in the specified paths.")
-        return None
+        browser_path = self._resolve_browser_path(browser_name_upper, tuple(browsers_map[browser_name_upper]))
+        if browser_path is None:
+            log_system(f"Error: Could not find a valid executable for {browser_name_upper} in the specified paths.")
+        return browser_path
 
     def setup_browser(self,
                   headless: bool = False,
@@ -924,16 +1848,18 @@ class BrowserManager:
                   browsers_map: Dict[str, List[str]] = {}
                  ) -> Optional[WebDriver]:
         if self.driver:
-            try:
-                _ = self.driver.window_handles
-                log_browser(self.instance_id, f"Browser instance already running.")
-                return self.driver
-            except WebDriverException:
-                log_browser(self.instance_id, f"Browser instance crashed/closed. Re-initializing.")
+            if self.is_alive():
+                if self.headless == headless:
+                    log_browser(self.instance_id, "Browser instance already running.")
+                    return self.driver
+                log_browser(self.instance_id, f"Browser instance running with headless={self.headless}. Restarting with headless={headless}.")
+                self.quit()
+            else:
+                log_browser(self.instance_id, "Browser instance crashed/closed. Re-initializing.")
                 self.driver = None
 
         # --- Get common settings ---
-        driver_version = settings.get(_SETTINGS_COLS["wd_ver"]) # WD_VER applies always
+        driver_version = settings.get(_SETTINGS_COLS["wd_ver"]) # Only pins stock Chrome and Edge, see below
         selected_browser_name = settings.get(_SETTINGS_COLS["use_browser"], "CHROME").upper()
 
         browser_path = None
@@ -949,7 +1875,7 @@ class BrowserManager:
 
             custom_path = Path(custom_path_setting)
             log_system(f"Checking custom browser path: {custom_path}")
-            if custom_path.exists() and custom_path.is_file():
+            if is_regular_file(custom_path):
                 log_system(f"Valid custom browser path found: {custom_path}")
                 browser_path = str(custom_path)
                 # Determine type for the custom path (using heuristic)
@@ -993,66 +1919,84 @@ class BrowserManager:
         # --- Now, proceed with WebDriver setup using browser_path and browser_name_to_use ---
         self.browser_type = browser_name_to_use # Store the determined type
         service_args = None
-        os.environ['WDM_LOG'] = str(logging.WARNING)
         if platform.system() == "Windows": service_args = ['--log-level=OFF']
 
         try:
             service = None
             options = None
-            wdm_driver_version = driver_version if driver_version else self.get_latest_version()
-
-            log_system(f"Configuring WebDriver for: {browser_name_to_use} (Path: {browser_path}, Driver Version: {wdm_driver_version})")
+            log_system(f"Configuring WebDriver for: {browser_name_to_use} (Path: {browser_path}, Driver Version: {driver_version or 'latest'})")
 
             # Map browser_name_to_use to WebDriver Managers and Options
             # (This mapping logic remains the same as the previous step)
             if browser_name_to_use == "CHROME":
                 options = ChromeOptions()
-                service = ChromeService(ChromeDriverManager(driver_version=wdm_driver_version).install(), service_args=service_args)
+                service = ChromeService(service_args=service_args)
                 self.browser_type_for_selenium = "chrome"
             elif browser_name_to_use == "EDGE":
                 options = EdgeOptions()
                 # options.binary_location = browser_path # Often needed, set below universally
-                service = EdgeService(EdgeChromiumDriverManager(driver_version=wdm_driver_version).install(), service_args=service_args)
+                service = EdgeService(service_args=service_args)
                 self.browser_type_for_selenium = "edge"
             elif browser_name_to_use == "BRAVE":
                 options = ChromeOptions()
                 # options.binary_location = browser_path # Often needed, set below universally
-                service = ChromeService(ChromeDriverManager(chrome_type=ChromeType.BRAVE, driver_version=wdm_driver_version).install(), service_args=service_args)
+                service = ChromeService(service_args=service_args)
                 self.browser_type_for_selenium = "chrome"
             elif browser_name_to_use in ["VIVALDI", "OPERA"]:
                 options = ChromeOptions()
                 # options.binary_location = browser_path # Often needed, set below universally
                 log_system(f"Attempting to use standard ChromeDriver for {browser_name_to_use}")
-                service = ChromeService(ChromeDriverManager(driver_version=wdm_driver_version).install(), service_args=service_args)
+                service = ChromeService(service_args=service_args)
                 self.browser_type_for_selenium = "chrome"
             else:
                 log_system(f"Error: Unsupported browser type '{browser_name_to_use}' determined.")
                 return None
 
             # --- Configure Options (Set binary location universally) ---
-            options.add_experimental_option('excludeSwitches', ['enable-logging'])
             options.binary_location = browser_path # Set the final path here
-
-            # ... (rest of the options configuration remains the same) ...
-            options.add_argument(f"--user-data-dir={self.user_data_path}")
-            options.add_argument(f"--remote-debugging-port={9222 + self.instance_id}")
-            options.add_argument("--disable-extensions")
-            options.add_argument("--disable-default-apps")
-            options.add_argument("--disable-popup-blocking")
-            options.add_argument("--no-first-run")
-            options.add_argument("--no-service-autorun")
-            options.add_argument("--password-store=basic")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option('useAutomationExtension', False)
-            options.add_argument(f"user-agent={settings.get('USER_AGENT')}")
+            # No driver path on the Service: Selenium Manager resolves a driver matching the browser binary and caches
+            # it on disk. WD_VER pins stock Chrome/Edge by major version, so a driver build number still matches. Brave,
+            # Vivaldi, Opera and CUSTOM_BSR_PATH builds have their own version numbers, so there the binary decides
+            if driver_version and selected_browser_name in ("CHROME", "EDGE"):
+                options.browser_version = driver_version.split(".")[0]
+            elif driver_version:
+                log_system(f"WD_VER is ignored for {selected_browser_name}; the driver is matched to the browser binary.")
+            options.arguments.extend(_STATIC_CHROME_ARGS)
+            for name, value in _CHROME_EXPERIMENTAL_OPTIONS:
+                options.add_experimental_option(name, value)
+
+            # Per-instance arguments
+            options.arguments.extend((
+                f"--user-data-dir={self.user_data_path}",
+                f"--remote-debugging-port={self.debugging_port}",
+                f"user-agent={settings.get('USER_AGENT')}",
+            ))
             if headless:
-                options.add_argument("--headless=new")
-                options.add_argument("--window-size=1920,1080")
-
-            log_system(f"Initializing {browser_name_to_use} instance {self.instance_id} (Headless: {headless})...")
+                options.arguments.extend(_HEADLESS_CHROME_ARGS)
+
+            # A browser still running on this instance's profile (e.g. after a crash) keeps the profile locked, so a new
+            # launch would fail; attaching to it also skips the browser start and the WhatsApp Web reload. Only a
+            # browser verified to be on this profile is attached to or closed, never another one using the port
+            running = running_browser_info(self.user_data_path)
+            if running and ("Headless" in running.get("User-Agent", "")) != headless:
+                log_system(f"Closing {browser_name_to_use} instance {self.instance_id} left running with headless={not headless}...")
+                if not close_running_browser(running, self.user_data_path):
+                    log_system(f"Warning: Instance {self.instance_id}'s old browser is still running; its profile may stay locked.")
+                running = None
+            self.attached = bool(running)
+            if self.attached:
+                log_system(f"Attaching to running {browser_name_to_use} instance {self.instance_id} ({running.get('Browser')})...")
+                options = type(options)() # Launch-only options are rejected when attaching
+                options.debugger_address = f"127.0.0.1:{running['port']}"
+            else:
+                if port_in_use(self.debugging_port):
+                    log_system(f"Port {self.debugging_port} is used by another program; instance {self.instance_id} uses a free DevTools port instead.")
+                    options.arguments.remove(f"--remote-debugging-port={self.debugging_port}")
+                    options.add_argument("--remote-debugging-port=0") # The browser picks one and writes it to DevToolsActivePort
+                log_system(f"Initializing {browser_name_to_use} instance {self.instance_id} (Headless: {headless})...")
+            # driver.get() returns at DOMContentLoaded instead of waiting for every image and script of WhatsApp Web;
+            # the send path waits for the elements it needs anyway, and the previous chat's DOM is already gone
+            options.page_load_strategy = "eager"
 
             # --- Initialize WebDriver ---
             if self.browser_type_for_selenium == "chrome":
@@ -1060,6 +2004,9 @@ class BrowserManager:
             elif self.browser_type_for_selenium == "edge":
                 self.driver = webdriver.Edge(service=service, options=options)
 
+            self.driver.set_script_timeout(_SCRIPT_TIMEOUT_S) # Attach scripts poll the page asynchronously
+            register_page_helpers(self.driver)
+            self.headless = headless
             log_system(f"{browser_name_to_use} instance {self.instance_id} initialized.")
             return self.driver
 
@@ -1083,29 +2030,331 @@ class BrowserManager:
             self.driver = None
             return None
 
+    def interrupt(self) -> None:
+        """
+        Stops this instance's WebDriver process from another thread, so a call blocked on it (a page load, a send
+        script) fails at once instead of running into its timeout. The next start re-initializes the instance.
+        """
+        driver = self.driver
+        if driver is None:
+            return
+        log_browser(self.instance_id, "Interrupting the browser call still running after stop...")
+        try: driver.service.stop() # quit() would queue behind the blocked call in the driver
+        except Exception as e: log_system(f"Exception while interrupting browser instance {self.instance_id}: {e}")
+        finally:
+            self.driver = None
+            self.attached = False
+            self._alive_checked_at = 0.0
+
     def quit(self) -> None: # [source: 87-88]
         if self.driver:
             log_system(f"Quitting browser instance {self.instance_id}...")
             try:
+                if self.attached: # quit() only detaches from a browser it didn't launch
+                    try: self.driver.execute_cdp_cmd("Browser.close", {})
+                    except WebDriverException: pass # The connection drops as the browser closes
                 self.driver.quit()
             except Exception as e: log_system(f"Exception while quitting browser instance {self.instance_id}: {e}")
             finally:
                 self.driver = None
+                self.attached = False
+                self._alive_checked_at = 0.0
                 log_system(f"Browser instance {self.instance_id} quit.")
 
+MAX_BROWSER_POOL_SIZE: Final = 2 # One GUI log pane per instance (Browser 1 / Browser 2)
+
+def browser_pool_size(settings: Dict[str, Any]) -> int:
+    """BROWSER_POOL_SIZE setting as an int from 1 to MAX_BROWSER_POOL_SIZE (default 2)."""
+    try:
+        size = max(1, int(float(settings.get(_SETTINGS_COLS["pool_size"]) or 2)))
+    except (TypeError, ValueError):
+        log_system(f"Warning: Invalid {_SETTINGS_COLS['pool_size']} '{settings.get(_SETTINGS_COLS['pool_size'])}', using 2.")
+        return 2
+    if size > MAX_BROWSER_POOL_SIZE:
+        log_system(f"Warning: {_SETTINGS_COLS['pool_size']} {size} is above {MAX_BROWSER_POOL_SIZE} (one log pane per browser), using {MAX_BROWSER_POOL_SIZE}.")
+        return MAX_BROWSER_POOL_SIZE
+    return size
+
+def message_delay_bounds(settings: Mapping[str, Any]) -> Tuple[float, float]:
+    """(MIN_TIMER, MAX_TIMER) as floats, parsed once per run instead of per contact; defaults on bad values."""
+    defaults = CONFIG["DEFAULT_SETTINGS"]
+    try:
+        min_t = float(settings.get(_SETTINGS_COLS["min_timer"]) or defaults["MIN_TIMER"])
+        max_t = float(settings.get(_SETTINGS_COLS["max_timer"]) or defaults["MAX_TIMER"])
+    except (TypeError, ValueError):
+        log_system(f"Warning: Invalid {_SETTINGS_COLS['min_timer']}/{_SETTINGS_COLS['max_timer']}, using {defaults['MIN_TIMER']}-{defaults['MAX_TIMER']}s.")
+        return float(defaults["MIN_TIMER"]), float(defaults["MAX_TIMER"])
+    return (min_t, max_t) if min_t <= max_t else (max_t, min_t)
+
+class BrowserPool:
+    """
+    Owns one BrowserManager per instance and keeps their sessions alive across runs.
+    During a phase, workers check instances out with acquire() and hand them back with release().
+    """
+    def __init__(self, size: int = 2) -> None:
+        self.managers: List[BrowserManager] = []
+        self.resize(size)
+        self._idle: "queue.SimpleQueue[BrowserManager]" = queue.SimpleQueue() # No task_done/join accounting needed
+        self._live_count = 0
+        self._live_lock = threading.Lock()
+        self._busy: "set[BrowserManager]" = set() # Checked out by a worker; guarded by _live_lock
+
+    def resize(self, size: int) -> None:
+        """Adds managers up to size; existing ones (and their sessions) are kept."""
+        while len(self.managers) < size:
+            self.managers.append(BrowserManager(instance_id=len(self.managers) + 1))
+
+    def warm(self,
+             headless: bool,
+             settings: Dict[str, Any],
+             browsers_map: Dict[str, List[str]],
+             count: Optional[int] = None) -> List[Optional[WebDriver]]:
+        """
+        Starts the first count instances (all by default) concurrently and returns their drivers in instance
+        order (None if one failed). Instances that are still alive with the same headless mode are reused.
+        """
+        managers = self.managers[:count] if count else self.managers
+        with ThreadPoolExecutor(max_workers=len(managers), thread_name_prefix="BrowserWarm") as pool:
+            futures = [pool.submit(self.start, manager, headless, settings, browsers_map) for manager in managers]
+            return [future.result() for future in futures]
+
+    def start(self,
+              manager: BrowserManager,
+              headless: bool,
+              settings: Dict[str, Any],
+              browsers_map: Dict[str, List[str]]) -> Optional[WebDriver]:
+        """Starts (or reuses) one instance; warm() and release()'s restart both go through here."""
+        driver = manager.setup_browser(headless, settings, browsers_map)
+        if driver:
+            wait_for_whatsapp_ready(driver, manager.instance_id, wait_for_scan=not headless)
+        return driver
+
+    def check_in(self, managers: List[BrowserManager]) -> None:
+        """Makes these (running) managers available to acquire() for the next phase."""
+        self._idle = queue.SimpleQueue()
+        for manager in managers:
+            self._idle.put(manager)
+        with self._live_lock:
+            self._live_count = len(managers)
+            self._busy = set() # A worker left over from a stopped phase must not release into this one
+
+    def acquire(self, stop_event: threading.Event) -> Optional[BrowserManager]:
+        """Waits for an idle instance; None once the run is stopped or no working instance is left."""
+        while not stop_event.is_set():
+            try:
+                manager = self._idle.get(timeout=0.5)
+            except queue.Empty:
+                with self._live_lock:
+                    if self._live_count == 0:
+                        return None
+                continue
+            with self._live_lock:
+                self._busy.add(manager)
+            return manager
+        return None
+
+    def release(self,
+                manager: BrowserManager,
+                headless: bool,
+                settings: Dict[str, Any],
+                browsers_map: Dict[str, List[str]]) -> None:
+        """Health-checks an instance before returning it; a dead one is restarted, or dropped if that fails."""
+        with self._live_lock:
+            if manager not in self._busy:
+                return # Interrupted on stop; the next warm() starts it again
+            self._busy.discard(manager)
+        if not manager.is_alive():
+            log_browser(manager.instance_id, "Browser disconnected. Restarting instance...")
+            manager.quit()
+            if not self.start(manager, headless, settings, browsers_map):
+                log_browser(manager.instance_id, "Restart failed. Instance removed from this run.")
+                with self._live_lock:
+                    self._live_count -= 1
+                return
+            manager.prepare_locators(settings)
+        self._idle.put(manager)
+
+    def interrupt_busy(self) -> List[BrowserManager]:
+        """Interrupts the instances still checked out (e.g. stuck in a page load after stop) and returns them."""
+        with self._live_lock:
+            busy, self._busy = list(self._busy), set()
+        for manager in busy:
+            manager.interrupt()
+        return busy
+
+    def quit_all(self) -> None:
+        with ThreadPoolExecutor(max_workers=len(self.managers), thread_name_prefix="BrowserQuit") as pool:
+            list(pool.map(BrowserManager.quit, self.managers))
+
 
 # --- WhatsApp Interaction Functions ---
-def wait_for_element(driver: WebDriver, xpath: str, timeout: int = 10) -> Optional[Any]:
-    try: return WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.XPATH, xpath)))
+Locator = Tuple[str, str]
+_WA_SEND_URL: Final = "https://web.whatsapp.com/send?phone="
+_QR_CODE_LOCATOR: Final = (By.CSS_SELECTOR, "canvas[aria-label*='Scan']") # Login QR shown when the session is logged out
+
+class HumanPacer:
+    """
+    Per-instance human-like delays: a private RNG (no contention on the global one) and send deadlines.
+    Delays are deadlines set after a send, so navigating to and loading the next chat count toward them.
+    """
+    def __init__(self, instance_id: int, message_delay: Tuple[float, float] = (2.0, 5.0)) -> None:
+        self.rng = random.Random(instance_id ^ time.time_ns())
+        self.next_send_at = time.monotonic()
+        self.next_message_at = self.next_send_at
+        self.message_delay = message_delay # From message_delay_bounds(settings), set once per run
+
+    def uniform(self, a: float, b: float) -> float:
+        return self.rng.uniform(a, b)
+
+    @staticmethod
+    def _sleep_until(deadline: float) -> None:
+        remaining = deadline - time.monotonic()
+        if remaining > 0:
+            time.sleep(remaining)
+
+    def wait_turn(self) -> None:
+        """Blocks until the deadline set by the previous send."""
+        self._sleep_until(self.next_send_at)
+
+    def mark_sent(self, a: float = 1.5, b: float = 3.5) -> None:
+        self.next_send_at = time.monotonic() + self.rng.uniform(a, b)
+
+    def message_wait_ms(self) -> int:
+        """Milliseconds until both before_message() and wait_turn() would return; for pauses taken inside the page."""
+        remaining = max(self.next_message_at, self.next_send_at) - time.monotonic()
+        return max(0, int(remaining * 1000))
+
+    def mark_message_sent(self) -> None:
+        self.mark_sent()
+        self.next_message_at = time.monotonic() + self.rng.uniform(*self.message_delay)
+
+@functools.lru_cache(maxsize=64)
+def _element_locators(css: str, xpath: str) -> Tuple[Locator, ...]:
+    return tuple(loc for loc in ((By.CSS_SELECTOR, css), (By.XPATH, xpath)) if loc[1])
+
+def element_locators(settings: Dict[str, Any], css_key: str, xpath_key: str) -> Tuple[Locator, ...]:
+    """Returns the pre-built (By, selector) pairs for an element: the CSS_* selector first, then the XPATH_* fallback."""
+    defaults = CONFIG["DEFAULT_SETTINGS"]
+    css = settings.get(css_key, defaults[css_key]) or ""
+    xpath = settings.get(xpath_key, defaults[xpath_key]) or ""
+    return _element_locators(str(css), str(xpath))
+
+def driver_wait(driver: WebDriver, timeout: float) -> WebDriverWait:
+    """Returns a WebDriverWait for this driver and timeout, reused across calls (each until() restarts the clock)."""
+    wait_cache = getattr(driver, "_wait_cache", None)
+    if wait_cache is None:
+        wait_cache = driver._wait_cache = {}
+    wait = wait_cache.get(timeout)
+    if wait is None:
+        wait = wait_cache[timeout] = WebDriverWait(driver, timeout, poll_frequency=_WAIT_POLL_S)
+    return wait
+
+def js_click(driver: WebDriver, element: Any) -> None:
+    """Clicks through JS: WA Web overlays often intercept native clicks, and the failed attempt costs a round-trip."""
+    driver.execute_script("arguments[0].click();", element)
+
+_WA_HOME_URL: Final = "https://web.whatsapp.com"
+_WA_READY_TIMEOUT_S: Final = 120 # A cold WhatsApp Web boot (or a QR scan) can take this long
+_CHAT_LIST_LOCATOR: Final = (By.CSS_SELECTOR, "#pane-side") # Only rendered once the session is logged in and synced
+
+def wait_for_whatsapp_ready(driver: WebDriver, instance_id: int, timeout: int = _WA_READY_TIMEOUT_S,
+                            wait_for_scan: bool = True) -> bool:
+    """
+    Makes sure WhatsApp Web is loaded and logged in before the first contact, so a cold boot isn't billed to that
+    contact's 15s chat wait. A session that is already up (e.g. reused from an earlier run) costs one lookup.
+    Without wait_for_scan (headless, where nobody can scan) a QR code ends the wait right away.
+    """
+    try:
+        if driver.find_elements(*_CHAT_LIST_LOCATOR):
+            return True
+        if "web.whatsapp.com" not in last_url(driver):
+            navigate(driver, _WA_HOME_URL)
+        log_browser(instance_id, "Waiting for WhatsApp Web to load...")
+        deadline = time.monotonic() + timeout
+        found = wait_for_element(driver, (_CHAT_LIST_LOCATOR, _QR_CODE_LOCATOR), timeout=timeout)
+        if found is not None and not driver.find_elements(*_CHAT_LIST_LOCATOR):
+            if not wait_for_scan:
+                log_browser(instance_id, "QR scan needed. Log in from 'Launch WA Web' first; headless runs can't be scanned.")
+                return False
+            log_browser(instance_id, "QR scan needed. Scan the code in this browser window to continue.")
+            found = wait_for_element(driver, (_CHAT_LIST_LOCATOR,), timeout=max(1, int(deadline - time.monotonic())))
+        if found is None:
+            log_browser(instance_id, f"WhatsApp Web not ready after {timeout:.0f}s; sends from this instance may fail.")
+            return False
+        log_browser(instance_id, "WhatsApp Web ready.")
+        return True
+    except WebDriverException as e:
+        log_browser(instance_id, f"Error waiting for WhatsApp Web: {e}")
+        return False
+
+def navigate(driver: WebDriver, url: str) -> None:
+    """
+    driver.get() that remembers the URL, so later checks don't need a current_url round-trip.
+    Returns at DOMContentLoaded (the "eager" page load strategy set in setup_browser).
+    """
+    driver._last_url = url
+    driver.get(url)
+
+def last_url(driver: WebDriver) -> str:
+    """The URL last opened through navigate(); asks the browser only if this driver hasn't navigated yet."""
+    url = getattr(driver, "_last_url", None)
+    if url is None:
+        url = driver._last_url = driver.current_url
+    return url
+
+@functools.lru_cache(maxsize=64) # Expected conditions are stateless, so one instance per locator set is enough
+def _any_locator(condition: Any, locators: Any) -> Any:
+    if isinstance(locators, str):
+        return condition((By.XPATH, locators))
+    if len(locators) == 1:
+        return condition(locators[0])
+    return EC.any_of(*(condition(loc) for loc in locators))
+
+def wait_for_element(driver: WebDriver, locators: Any, timeout: int = 10) -> Optional[Any]:
+    """Waits for the first of the given locators (or a single XPath string) to be present."""
+    try: return driver_wait(driver, timeout).until(_any_locator(EC.presence_of_element_located, locators))
     except TimeoutException: return None
     except NoSuchElementException: return None
     except Exception: return None
 
-def wait_for_clickable(driver: WebDriver, xpath: str, timeout: int = 10) -> Optional[Any]:
-    try: return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.XPATH, xpath)))
+def wait_for_clickable(driver: WebDriver, locators: Any, timeout: int = 10) -> Optional[Any]:
+    """Waits for the first of the given locators (or a single XPath string) to be clickable."""
+    try: return driver_wait(driver, timeout).until(_any_locator(EC.element_to_be_clickable, locators))
     except TimeoutException: return None
     except Exception: return None
 
+
+@functools.lru_cache(maxsize=8)
+def _invalid_popup_locator(invalid_msg_text: str) -> Locator:
+    return (By.XPATH, f"//div[contains(text(), \"{invalid_msg_text}\")]/ancestor::div[@role='dialog']//button")
+
+class SendLocators(NamedTuple):
+    """Locators used by send_text_message and attach_and_send_files, built once per run from settings."""
+    text: Tuple[Locator, ...]
+    send: Tuple[Locator, ...]
+    invalid: Locator
+    attach: Tuple[Locator, ...]
+    asend: Tuple[Locator, ...]
+    docs: Tuple[Locator, ...]
+    media: Tuple[Locator, ...]
+    qr: Locator = _QR_CODE_LOCATOR
+
+    def option(self, file_type: str) -> Optional[Tuple[Locator, ...]]:
+        """Returns the attach-menu option locators for DOCS or MEDIA."""
+        return self.docs if file_type == "DOCS" else self.media if file_type == "MEDIA" else None
+
+def build_send_locators(settings: Dict[str, Any]) -> SendLocators:
+    defaults = CONFIG["DEFAULT_SETTINGS"]
+    return SendLocators(
+        text=element_locators(settings, "CSS_TEXT", "XPATH_TEXT"),
+        send=element_locators(settings, "CSS_SEND", "XPATH_SEND"),
+        invalid=_invalid_popup_locator(settings.get("INVALID_MSG", defaults["INVALID_MSG"])),
+        attach=element_locators(settings, "CSS_ATTACH", "XPATH_ATTACH"),
+        asend=element_locators(settings, "CSS_ASEND", "XPATH_ASEND"),
+        docs=element_locators(settings, "CSS_DOCS", "XPATH_DOCS"),
+        media=element_locators(settings, "CSS_MEDIA", "XPATH_MEDIA"),
+    )
+
 def send_text_message(
     driver: WebDriver,
     phone_number: str,
@@ -1113,7 +2362,10 @@ def send_text_message(
     contact_details: Dict[str, Any],
     instance_id: int,
     settings: Dict[str, Any],
-    custom_placeholders: Dict[str, str] # Added custom_placeholders arg
+    custom_placeholders: Dict[str, str], # Added custom_placeholders arg
+    rendered_message: Optional[str] = None,
+    pacer: Optional[HumanPacer] = None,
+    locators: Optional[SendLocators] = None
 ) -> str:
     """
     Sends a text message to the specified phone number using WhatsApp Web.
@@ -1126,6 +2378,9 @@ def send_text_message(
         instance_id: The ID of the current instance.
         settings: A dictionary containing configuration settings, including XPath locators.
         custom_placeholders: A dictionary of custom placeholders and their values.
+        rendered_message: The message already personalized and encoded by the loader, if available.
+        pacer: The browser instance's HumanPacer; a fresh one is used if omitted.
+        locators: The browser instance's prepared SendLocators; built from settings if omitted.
 
     Returns:
         A string indicating the status of the message ("SENT", "FAILED", or "INVALID").
@@ -1133,71 +2388,39 @@ def send_text_message(
     status = "FAILED"
     if not message_template or pd.isna(message_template):
         return "INVALID"
+    pacer = pacer or HumanPacer(instance_id)
 
-    final_message_encoded = personalize_message(message_template, contact_details, custom_placeholders) # Pass custom_placeholders
+    final_message_encoded = rendered_message or personalize_message(message_template, contact_details, custom_placeholders) # Pass custom_placeholders
     if not final_message_encoded:
         return "INVALID"
 
-    base_url = "https://web.whatsapp.com"
-    send_url = f"{base_url}/send?phone={phone_number}&text={final_message_encoded}&app_absent=0"
+    locators = locators or build_send_locators(settings)
+    send_url = f"{_WA_SEND_URL}{phone_number}&text={final_message_encoded}&app_absent=0"
 
     try:
-        driver.get(send_url)
-        xpath_textbox = settings.get("XPATH_TEXT", CONFIG["DEFAULT_SETTINGS"]["XPATH_TEXT"])
-        invalid_msg_text = settings.get("INVALID_MSG", CONFIG["DEFAULT_SETTINGS"]["INVALID_MSG"])
-        xpath_invalid_popup_button = f"//div[contains(text(), \"{invalid_msg_text}\")]/ancestor::div[@role='dialog']//button"
-
-        try:
-            WebDriverWait(driver, 15).until(
-                EC.any_of(
-                    EC.presence_of_element_located((By.XPATH, xpath_textbox)),
-                    EC.presence_of_element_located((By.XPATH, xpath_invalid_popup_button)),
-                )
-            )
-        except TimeoutException:
+        navigate(driver, send_url)
+
+        # Waiting for the chat, dismissing the invalid-number popup, the pacing pause and the send click all run in
+        # one async script; only pauses longer than the in-page cap are slept here first
+        pace_ms = pacer.message_wait_ms()
+        if pace_ms > _IN_PAGE_PACE_MAX_MS:
+            time.sleep((pace_ms - _IN_PAGE_PACE_MAX_MS) / 1000)
+            pace_ms = _IN_PAGE_PACE_MAX_MS
+        result = call_page_helper(driver, "sendInChat", locators.text, locators.invalid, locators.send,
+                                  _CHAT_LOAD_MS, pace_ms, _SEND_READY_MS)
+        if result == "invalid":
+            log_browser(instance_id, f"Invalid number {phone_number}.")
+            return "INVALID"
+        if result == "loading":
             log_browser(instance_id, f"Timeout waiting for chat/popup for {phone_number}.")
-            if "Scan QR code" in driver.page_source:
+            if driver.find_elements(*locators.qr): # Cheap element lookup instead of serializing page_source
                 log_browser(instance_id, "QR scan needed.")
             return "FAILED"
-
-        invalid_popup = driver.find_elements(By.XPATH, xpath_invalid_popup_button)
-        if invalid_popup:
-            log_browser(instance_id, f"Invalid number {phone_number}.")
-            try:
-                invalid_popup[0].click()
-            except Exception:
-                pass
-            return "INVALID"
-
-        send_button_xpath = settings.get("XPATH_SEND", CONFIG["DEFAULT_SETTINGS"]["XPATH_SEND"])
-        send_button = wait_for_clickable(driver, send_button_xpath, timeout=10)
-        if not send_button:
+        if result != "clicked":
             log_browser(instance_id, f"Send button not found for {phone_number}.")
             return "FAILED"
-
-        time.sleep(random.uniform(0.5, 1.5))
-        try:
-            send_button.click()
-            status = "SENT"
-            time.sleep(random.uniform(1.0, 2.0))
-        except (ElementClickInterceptedException, StaleElementReferenceException) as click_err:
-            log_browser(instance_id, f"Click failed for send button ({phone_number}): {click_err}. Retrying JS...")
-            try:
-                time.sleep(1)
-                send_button = wait_for_clickable(driver, send_button_xpath, timeout=5)
-                if send_button:
-                    driver.execute_script("arguments[0].click();", send_button)
-                    status = "SENT"
-                    time.sleep(random.uniform(1.0, 2.0))
-                else:
-                    log_browser(instance_id, f"Send button not found on retry.")
-                    status = "FAILED"
-            except Exception as retry_err:
-                log_browser(instance_id, f"Error sending (retry click): {retry_err}")
-                status = "FAILED"
-        except Exception as e:
-            log_browser(instance_id, f"Unexpected error sending: {e}")
-            status = "FAILED"
+        status = "SENT"
+        pacer.mark_message_sent()
     except WebDriverException as e:
         log_browser(instance_id, f"WebDriver error sending text: {e}")
         status = "FAILED"
@@ -1208,179 +2431,435 @@ def send_text_message(
         status = "FAILED"
     return status
 
+# Page helpers, registered once per browser with Page.addScriptToEvaluateOnNewDocument (see register_page_helpers)
+# so each call only sends the helper name and arguments. Every helper takes the async-script callback last.
+#   prepareAttach: clicks the paperclip, waits for the wanted file input, forces every file input visible and
+#     returns it (or null).
+#   clickSend: waits for the chat's send button to be enabled and clicks it. Resolves 'clicked' or 'missing'.
+#   sendInChat: waits for the chat being opened to show the composer, then for paceMs (counted from the call) to pass,
+#     then runs clickSend. Resolves 'invalid' (after dismissing the invalid-number popup), 'loading' on timeout, or
+#     clickSend's result.
+#   clickAttachSend: waits for the preview's send button to be enabled, clicks it and waits for the preview to
+#     close. Resolves 'sent', 'clicked' (preview still open) or 'missing' (button never became ready).
+#   chatState: polls the chat being opened until the composer ('loaded') or the invalid-number popup ('invalid')
+#     shows up. Resolves 'loading' on timeout.
+#   waitOutgoing: resolves true once the attachment preview is gone and no outgoing message in the open chat shows
+#     the pending clock for two polls in a row, false on timeout. One call confirms everything a contact was sent.
+_WA_HELPERS_JS: Final = """
+window.__waHelpers = (() => {
+    const findLocator = ([by, value]) => {
+        try {
+            return by === 'xpath'
+                ? document.evaluate(value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+                : document.querySelector(value);
+        } catch (e) { return null; }
+    };
+    const isReady = (el) => el && !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+    const revealFileInputs = (done) => {
+        for (const el of document.querySelectorAll('input[type="file"]')) {
+            Object.assign(el.style, {display: 'block', visibility: 'visible', width: '1px', height: '1px', opacity: 1});
+        }
+        if (done) done(true);
+    };
+    const prepareAttach = (attachLocators, inputSelector, timeoutMs, done) => {
+        const attach = attachLocators.map(findLocator).find(Boolean);
+        if (!attach) return done(null);
+        attach.click();
+        const deadline = Date.now() + timeoutMs;
+        (function poll() {
+            const input = document.querySelector(inputSelector);
+            if (input) {
+                revealFileInputs();
+                return done(input);
+            }
+            if (Date.now() > deadline) return done(null);
+            setTimeout(poll, 100);
+        })();
+    };
+    const clickSend = (sendLocators, readyMs, done) => {
+        const deadline = Date.now() + readyMs;
+        (function poll() {
+            const button = sendLocators.map(findLocator).find(isReady);
+            if (button) {
+                button.click();
+                return done('clicked');
+            }
+            if (Date.now() > deadline) return done('missing');
+            setTimeout(poll, 100);
+        })();
+    };
+    const sendInChat = (composerLocators, invalidLocator, sendLocators, loadMs, paceMs, readyMs, done) => {
+        const start = Date.now();
+        (function waitChat() {
+            const invalid = findLocator(invalidLocator);
+            if (invalid) {
+                invalid.click();
+                return done('invalid');
+            }
+            if (composerLocators.some((loc) => findLocator(loc))) {
+                const pause = Math.max(0, start + paceMs - Date.now());
+                return setTimeout(() => clickSend(sendLocators, readyMs, done), pause);
+            }
+            if (Date.now() > start + loadMs) return done('loading');
+            setTimeout(waitChat, 100);
+        })();
+    };
+    const clickAttachSend = (sendLocators, readyMs, closeMs, done) => {
+        const readyDeadline = Date.now() + readyMs;
+        (function waitReady() {
+            const button = sendLocators.map(findLocator).find(isReady);
+            if (button) {
+                button.click();
+                const closeDeadline = Date.now() + closeMs;
+                (function waitClosed() {
+                    if (!button.isConnected) return done('sent');
+                    if (Date.now() > closeDeadline) return done('clicked');
+                    setTimeout(waitClosed, 100);
+                })();
+                return;
+            }
+            if (Date.now() > readyDeadline) return done('missing');
+            setTimeout(waitReady, 100);
+        })();
+    };
+    const chatState = (composerLocators, invalidLocator, timeoutMs, done) => {
+        const deadline = Date.now() + timeoutMs;
+        (function poll() {
+            if (findLocator(invalidLocator)) return done('invalid');
+            if (composerLocators.some((loc) => findLocator(loc))) return done('loaded');
+            if (Date.now() > deadline) return done('loading');
+            setTimeout(poll, 200);
+        })();
+    };
+    const waitOutgoing = (previewSendLocators, pendingSelector, timeoutMs, done) => {
+        const deadline = Date.now() + timeoutMs;
+        let settledPolls = 0;
+        (function poll() {
+            const busy = previewSendLocators.some((loc) => findLocator(loc)) || document.querySelector(pendingSelector);
+            settledPolls = busy ? 0 : settledPolls + 1;
+            if (settledPolls >= 2) return done(true);
+            if (Date.now() > deadline) return done(false);
+            setTimeout(poll, 250);
+        })();
+    };
+    return {revealFileInputs, prepareAttach, clickSend, sendInChat, clickAttachSend, chatState, waitOutgoing};
+})();
+"""
+_WA_HELPERS_MISSING: Final = "__wa_helpers_missing__"
+_CALL_PAGE_HELPER_JS: Final = """
+const args = Array.from(arguments);
+const done = args[args.length - 1];
+if (!window.__waHelpers) return done('""" + _WA_HELPERS_MISSING + """');
+window.__waHelpers[args[0]](...args.slice(1));
+"""
+_CHAT_PROBE_MS: Final = 5000
+_SEND_READY_MS: Final = 10000
+_CHAT_LOAD_MS: Final = 15000
+_IN_PAGE_PACE_MAX_MS: Final = 30000 # Keeps sendInChat (load + pace + ready) well inside _SCRIPT_TIMEOUT_S
+_PENDING_MESSAGE_CSS: Final = '#main span[data-icon="msg-time"]'
+_OUTGOING_CONFIRM_MS: Final = 60000
+_SCRIPT_TIMEOUT_S: Final = 75 # Covers the longest async attach script (30s ready + 30s close) plus slack
+_FILE_INPUT_CSS: Final = {
+    "DOCS": 'input[type="file"][accept="*"]',
+    "MEDIA": 'input[type="file"][accept*="image"]',
+}
+
+def register_page_helpers(driver: WebDriver) -> None:
+    """Registers _WA_HELPERS_JS for every document this browser loads; call_page_helper injects it on demand otherwise."""
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": _WA_HELPERS_JS})
+    except Exception as e:
+        logging.debug(f"Page helpers not registered via CDP: {e}")
+
+def call_page_helper(driver: WebDriver, name: str, *args: Any) -> Any:
+    """Runs window.__waHelpers[name](*args, done) as an async script, injecting the helpers first if the page lacks them."""
+    result = driver.execute_async_script(_CALL_PAGE_HELPER_JS, name, *args)
+    if result == _WA_HELPERS_MISSING:
+        driver.execute_script(_WA_HELPERS_JS)
+        result = driver.execute_async_script(_CALL_PAGE_HELPER_JS, name, *args)
+    return result
+
+def wait_for_outgoing(driver: WebDriver, locators: SendLocators, timeout_ms: int = _OUTGOING_CONFIRM_MS) -> bool:
+    """Waits, in one async script, until every message queued in the open chat has left the pending state."""
+    try:
+        return bool(call_page_helper(driver, "waitOutgoing", locators.asend, _PENDING_MESSAGE_CSS, timeout_ms))
+    except Exception:
+        return False
+
+def probe_chat_state(driver: WebDriver, locators: SendLocators, timeout_ms: int = _CHAT_PROBE_MS) -> str:
+    """Returns "loaded", "invalid" or "loading" (timed out) for the chat being opened, from one async script."""
+    try:
+        return call_page_helper(driver, "chatState", locators.text, locators.invalid, timeout_ms) or "loading"
+    except Exception:
+        return "loading"
+
+def cdp_set_files(driver: WebDriver, input_css: str, file_paths: List[str]) -> bool:
+    """
+    Sets the whole FileList of the first input matching input_css in one DevTools DOM.setFileInputFiles call,
+    instead of streaming the joined paths through send_keys. Returns False if CDP is unavailable or the input is gone.
+    """
+    try:
+        node = driver.execute_cdp_cmd("Runtime.evaluate", {"expression": f"document.querySelector({json.dumps(input_css)})"})
+        object_id = node.get("result", {}).get("objectId")
+        if not object_id:
+            return False
+        driver.execute_cdp_cmd("DOM.setFileInputFiles", {"files": list(file_paths), "objectId": object_id})
+        return True
+    except Exception:
+        return False
+
+class _OptionInputReady:
+    """
+    Wait condition for the attach-menu fallback: clicks the DOCS/MEDIA option once it is enabled, then returns
+    the file input as soon as it exists, so both steps share one polling loop.
+    """
+    def __init__(self, option_locators: Tuple[Locator, ...], input_css: str) -> None:
+        self.option_locators = option_locators
+        self.input_css = input_css
+        self.clicked = False
+
+    def __call__(self, driver: WebDriver) -> Any:
+        try:
+            if not self.clicked:
+                for locator in self.option_locators:
+                    buttons = driver.find_elements(*locator)
+                    if buttons and buttons[0].is_displayed() and buttons[0].is_enabled():
+                        js_click(driver, buttons[0])
+                        self.clicked = True
+                        break
+                else:
+                    return False
+            inputs = driver.find_elements(By.CSS_SELECTOR, self.input_css)
+            if not inputs:
+                return False
+            call_page_helper(driver, "revealFileInputs")
+            return inputs[0]
+        except StaleElementReferenceException:
+            return False
+
 def attach_and_send_files(driver: WebDriver,
                           phone_number: str,
                           file_paths: List[str],
                           file_type: str,
                           instance_id: int,
-                          settings: Dict[str, Any]) -> bool:
+                          settings: Dict[str, Any],
+                          pacer: Optional[HumanPacer] = None,
+                          skip_navigation: bool = False,
+                          locators: Optional[SendLocators] = None,
+                          await_close: bool = True) -> str:
+    """
+    Attaches file_paths as DOCS or MEDIA in the chat with phone_number and sends them.
+    file_paths must be the absolute, existing paths stored in docs_map/media_map by the loader.
+    skip_navigation: the chat is already open from a previous action on this contact, so the URL check
+    and chat load probe are skipped.
+    locators: the browser instance's prepared SendLocators; built from settings if omitted.
+    await_close: wait for the preview to close after clicking Send. Only needed when another attachment follows;
+    the last one is confirmed together with the rest of the contact's messages by wait_for_outgoing.
+    Returns "SENT", "FAILED", or "INVALID" (WhatsApp rejected the number while opening the chat).
+    """
     if not file_paths:
-        return True 
+        return "SENT" 
+    pacer = pacer or HumanPacer(instance_id)
+    locators = locators or build_send_locators(settings)
 
-    chat_url = f"https://web.whatsapp.com/send?phone={phone_number}"
+    chat_url = f"{_WA_SEND_URL}{phone_number}"
 
     try:
-        # Navigate to the chat if not already there
-        if phone_number not in driver.current_url:
-            log_browser(instance_id, f"Navigating to chat for {phone_number} to attach {file_type}...")
-            driver.get(chat_url)
-            xpath_text = settings.get("XPATH_TEXT", CONFIG["DEFAULT_SETTINGS"]["XPATH_TEXT"])
-            if not wait_for_element(driver, xpath_text, timeout=10):
-                log_browser(instance_id, f"Failed to open chat for {phone_number}.")
-                return False
-
-        time.sleep(random.uniform(1.0, 2.0))
-
-        # Click the attach (paperclip) button
-        attach_xpath = settings.get("XPATH_ATTACH", CONFIG["DEFAULT_SETTINGS"]["XPATH_ATTACH"])
-        attach_button = wait_for_clickable(driver, attach_xpath, timeout=10)
-        if not attach_button:
-            log_browser(instance_id, f"Attach button not found for {phone_number}.")
-            return False
-        try:
-            attach_button.click()
-        except Exception:
-            driver.execute_script("arguments[0].click();", attach_button)
-        time.sleep(1)
-
-        # Force all file inputs to be visible
-        def force_visible_inputs():
-            driver.execute_script("""
-                const inputs = document.querySelectorAll('input[type="file"]');
-                for (const input of inputs) {
-                    input.style.display = 'block';
-                    input.style.visibility = 'visible';
-                    input.style.width = '1px';
-                    input.style.height = '1px';
-                    input.style.opacity = 1;
-                }
-            """)
-
-        force_visible_inputs()
-        time.sleep(0.5)
+        if not skip_navigation:
+            # Navigate to the chat if not already there
+            if phone_number not in last_url(driver):
+                log_browser(instance_id, f"Navigating to chat for {phone_number} to attach {file_type}...")
+                navigate(driver, chat_url)
+                chat_state = probe_chat_state(driver, locators)
+                if chat_state == "invalid":
+                    log_browser(instance_id, f"Invalid number {phone_number}.")
+                    return "INVALID"
+                if chat_state != "loaded":
+                    log_browser(instance_id, f"Failed to open chat for {phone_number}.")
+                    return "FAILED"
 
         # Select correct input and fallback icon
-        if file_type == "DOCS":
-            xpath_input = '//input[@type="file" and @accept="*"]'
-            xpath_option = settings.get("XPATH_DOCS", CONFIG["DEFAULT_SETTINGS"]["XPATH_DOCS"])
-        elif file_type == "MEDIA":
-            xpath_input = '//input[@type="file" and contains(@accept, "image")]'
-            xpath_option = settings.get("XPATH_MEDIA", CONFIG["DEFAULT_SETTINGS"]["XPATH_MEDIA"])
-        else:
+        input_css = _FILE_INPUT_CSS.get(file_type)
+        option_locators = locators.option(file_type)
+        if input_css is None or option_locators is None:
             log_browser(instance_id, f"Unknown file type '{file_type}'")
-            return False
+            return "FAILED"
 
-        # Try to locate input element
-        try:
-            file_input = WebDriverWait(driver, 5).until(
-                EC.presence_of_element_located((By.XPATH, xpath_input))
-            )
-        except TimeoutException:
-            log_browser(instance_id, f"{file_type} input not found after forcing visibility for {phone_number}. Retrying...")
+        # Click the attach (paperclip) button and expose the file input in one round-trip
+        file_input = call_page_helper(driver, "prepareAttach", locators.attach, input_css, 5000)
+        if file_input is None:
+            log_browser(instance_id, f"{file_type} input not found after opening the attach menu for {phone_number}. Retrying...")
 
-            option_button = wait_for_clickable(driver, xpath_option, timeout=5)
-            if option_button:
-                try:
-                    option_button.click()
-                    time.sleep(1)
-                    force_visible_inputs()
-                    file_input = WebDriverWait(driver, 5).until(
-                        EC.presence_of_element_located((By.XPATH, xpath_input))
-                    )
-                except Exception as retry_err:
+            option_ready = _OptionInputReady(option_locators, input_css)
+            try:
+                file_input = driver_wait(driver, 10).until(option_ready)
+            except Exception as retry_err:
+                if option_ready.clicked:
                     log_browser(instance_id, f"Retry failed: Could not expose file input for {file_type} ({phone_number}): {retry_err}")
-                    return False
-            else:
-                log_browser(instance_id, f"Retry failed: {file_type} icon button not found.")
-                return False
-
-        # Check if any valid files exist
-        absolute_paths = [str(Path(p).resolve()) for p in file_paths if Path(p).exists()]
-        if not absolute_paths:
-            log_browser(instance_id, f"No valid files to send to {phone_number}. Skipping.")
-            return True
+                else:
+                    log_browser(instance_id, f"Retry failed: {file_type} icon button not found.")
+                return "FAILED"
 
-        # Send files
+        # Send files (file_paths were resolved and checked when the DOCS/MEDIA sheets were loaded)
         try:
-            file_input.send_keys("\n".join(absolute_paths))
-            log_browser(instance_id, f"Sent {len(absolute_paths)} {file_type} file(s) to {phone_number}.")
+            if not cdp_set_files(driver, input_css, file_paths):
+                file_input.send_keys("\n".join(file_paths))
+            log_browser(instance_id, f"Sent {len(file_paths)} {file_type} file(s) to {phone_number}.")
         except Exception as send_err:
             log_browser(instance_id, f"Error sending file paths to input for {phone_number}: {send_err}")
-            return False
+            return "FAILED"
 
-        # Click the final "Send" button
-        send_xpath = settings.get("XPATH_ASEND", CONFIG["DEFAULT_SETTINGS"]["XPATH_ASEND"])
-        send_button = wait_for_clickable(driver, send_xpath, timeout=30)
-        if not send_button:
+        # Click the final "Send" button once enabled and (optionally) wait for the preview to close, in one round-trip
+        pacer.wait_turn()
+        outcome = call_page_helper(driver, "clickAttachSend", locators.asend, 30000, 30000 if await_close else 0)
+        if outcome == "missing":
             log_browser(instance_id, f"Send button (after attachment) not found for {phone_number}.")
-            return False
-        try:
-            send_button.click()
-        except Exception:
-            driver.execute_script("arguments[0].click();", send_button)
-        time.sleep(random.uniform(1.0, 2.5))
-        return True
+            return "FAILED"
+        if await_close and outcome != "sent":
+            log_browser(instance_id, f"Attachment preview still open after sending to {phone_number}.")
+        pacer.mark_sent()
+        return "SENT"
 
     except Exception as e:
         log_browser(instance_id, f"General error sending {file_type} to {phone_number}: {e}")
         logging.exception("Attachment error:")
-        return False
+        return "FAILED"
 
 # --- Core Contact Processing Logic (Modified) ---
+# Loose E.164 check (optional '+', 7-15 digits, no leading 0) after dropping common separators. A local number's
+# trunk '0' and a '00' international prefix are allowed and left to WhatsApp, as before. Numbers that fail it
+# can't open a chat, so they are marked INVALID up front instead of waiting out WhatsApp's invalid-number popup.
+_PHONE_SEPARATORS_RE: Final = re.compile(r"[\s\-().]")
+_PHONE_NUMBER_RE: Final = re.compile(r"(?:\+|0{1,2})?[1-9]\d{6,14}")
+
+class ContactTask(NamedTuple):
+    """One contact's pre-resolved work, built for a whole phase at once by build_contact_tasks."""
+    row_label: Any # DataFrame index label, for log messages
+    phone: str
+    name: str
+    msg_code: str
+    doc_code: str
+    media_code: str
+    message_template: Optional[str]
+    rendered_message: Optional[str]
+    doc_files: Optional[List[str]]
+    media_files: Optional[List[str]]
+    invalid_code: Optional[str] # "Phone" if the number can't be one, else "Msg", "Doc" or "Media" for an undefined code
+    details: Dict[str, Any] # The LIST row, for placeholder substitution when no pre-rendered message exists
+
+def build_contact_tasks(contacts: pd.DataFrame,
+                        messages_map: Dict[str, str],
+                        docs_map: Dict[str, List[str]],
+                        media_map: Dict[str, List[str]],
+                        custom_placeholders: Optional[Dict[str, str]] = None) -> List[ContactTask]:
+    """
+    Resolves codes, templates, files and code validation for every contact with column-wise map/isin,
+    so workers don't repeat per-row normalize_value calls and dict lookups.
+    With custom_placeholders, messages the loader did not pre-render are rendered here, and each contact's details
+    only hold the LIST columns its phase's templates use.
+    """
+    if contacts.empty:
+        return []
+    index = contacts.index
+
+    def column(key: str) -> pd.Series:
+        col = _LIST_COLS[key]
+        return normalize_series(contacts[col]) if col in contacts.columns else pd.Series("", index=index, dtype=object)
+
+    msg_codes, doc_codes, media_codes = column("msg_code"), column("doc_code"), column("media_code")
+    # "0" means the action is not wanted for this contact
+    wants_msg, wants_doc, wants_media = msg_codes.ne("0"), doc_codes.ne("0"), media_codes.ne("0")
+    templates = msg_codes.map(messages_map).where(wants_msg, None)
+    doc_files = doc_codes.map(docs_map).where(wants_doc, None)
+    media_files = media_codes.map(media_map).where(wants_media, None)
+
+    invalid_code = pd.Series(None, index=index, dtype=object)
+    invalid_code = invalid_code.mask(wants_media & ~media_codes.isin(media_map.keys()), "Media")
+    invalid_code = invalid_code.mask(wants_doc & ~doc_codes.isin(docs_map.keys()), "Doc")
+    invalid_code = invalid_code.mask(wants_msg & ~msg_codes.isin(messages_map.keys()), "Msg")
+    phones = contacts[_LIST_COLS["phone"]] # Normalized by the loader
+    digits = phones.str.replace(_PHONE_SEPARATORS_RE, "", regex=True)
+    invalid_code = invalid_code.mask(phones.ne("") & ~digits.str.fullmatch(_PHONE_NUMBER_RE), "Phone")
+
+    rendered_col = _LIST_COLS["rendered_message"]
+    rendered = contacts[rendered_col] if rendered_col in contacts.columns else pd.Series("", index=index, dtype=object)
+    if custom_placeholders is not None:
+        # Render whatever the loader didn't (e.g. rows it saw as SENT) here, once per template, instead of in the worker
+        unrendered = templates.notna() & ~rendered.map(lambda r: isinstance(r, str) and bool(r))
+        if unrendered.any():
+            rendered = rendered.astype(object) # astype copies, so the loader's frame is left untouched
+            for template, group in contacts[unrendered].groupby(templates[unrendered], sort=False):
+                rendered.loc[group.index] = render_messages(template, group, custom_placeholders)
+    if custom_placeholders is None:
+        detail_cols = list(contacts.columns)
+    else:
+        placeholder_items = tuple(custom_placeholders.items())
+        used_headers = {
+            list_header
+            for template in templates.dropna().unique()
+            for _, list_header, _, _ in compile_template(template, placeholder_items)
+            if list_header is not None
+        }
+        detail_cols = [col for col in contacts.columns if col in used_headers]
+    details = contacts[detail_cols].to_dict("records") if detail_cols else [{} for _ in range(len(index))]
+    return [
+        ContactTask(*values) for values in zip(
+            index.tolist(),
+            phones.tolist(),
+            column("resolved_name").tolist(),
+            msg_codes.tolist(), doc_codes.tolist(), media_codes.tolist(),
+            [t if isinstance(t, str) else None for t in templates.tolist()],
+            [r if isinstance(r, str) and r else None for r in rendered.tolist()],
+            [f if isinstance(f, list) else None for f in doc_files.tolist()],
+            [f if isinstance(f, list) else None for f in media_files.tolist()],
+            [c if isinstance(c, str) else None for c in invalid_code.tolist()],
+            details,
+        )
+    ]
+
+def invalid_contact_message(contact: ContactTask) -> str:
+    if contact.invalid_code == "Phone":
+        return f"Invalid phone number {contact.phone}."
+    invalid_value = {"Msg": contact.msg_code, "Doc": contact.doc_code, "Media": contact.media_code}[contact.invalid_code]
+    return f"Invalid {contact.invalid_code} Code {invalid_value} for {contact.phone}."
+
 def process_contact(
     driver: WebDriver,
-    contact: pd.Series,
-    messages_map: Dict[str, str],
-    docs_map: Dict[str, List[str]],
-    media_map: Dict[str, List[str]],
+    contact: ContactTask,
     instance_id: int,
     settings: Dict[str, Any],
     stop_event: threading.Event,
-    final_statuses: Dict[str, int],
-    status_update_lock: threading.Lock,
+    status_queue: "queue.SimpleQueue[Tuple[str, int]]",
     custom_placeholders: Dict[str, str],
+    pacer: Optional[HumanPacer] = None,
+    send_locators: Optional[SendLocators] = None,
 ) -> None:
     """
-    Processes a single contact, using custom placeholders & updating final_statuses dict.
+    Processes a single contact, using custom placeholders; the resulting (phone, status) is put on status_queue.
     """
     if stop_event.is_set():
         return
+    pacer = pacer or HumanPacer(instance_id, message_delay_bounds(settings))
+    send_locators = send_locators or build_send_locators(settings)
 
-    phone = normalize_value(contact.get(_LIST_COLS["phone"]))
-    resolved_name = contact.get(_LIST_COLS["resolved_name"], "")
+    phone = contact.phone
 
     if not phone:
-        log_browser(instance_id, f"Skipping missing phone (Index: {contact.name}).")
+        log_browser(instance_id, f"Skipping missing phone (Index: {contact.row_label}).")
         return
 
     current_status = _STATUS_VALS["RETRY"]
 
     try:
-        # Extract codes
-        msg_code = normalize_value(contact.get(_LIST_COLS["msg_code"]))
-        doc_code = normalize_value(contact.get(_LIST_COLS["doc_code"]))
-        media_code = normalize_value(contact.get(_LIST_COLS["media_code"]))
-
-        contact_details = contact.to_dict()
-
-        # Look up templates/files
-        message_template = messages_map.get(msg_code) if msg_code != "0" else None
-        doc_files = docs_map.get(doc_code)    if doc_code  != "0" else None
-        media_files = media_map.get(media_code) if media_code!= "0" else None
-
-        has_message = bool(msg_code != "0" and message_template)
-        has_docs = bool(doc_code != "0" and doc_files)
-        has_media = bool(media_code != "0" and media_files)
+        msg_code, doc_code, media_code = contact.msg_code, contact.doc_code, contact.media_code
+        message_template = contact.message_template
+        has_message = bool(message_template)
+        has_docs = bool(contact.doc_files)
+        has_media = bool(contact.media_files)
 
         # Validation
-        if msg_code != "0" and msg_code not in messages_map:
-            log_browser(instance_id, f"Invalid Msg Code {msg_code} for {phone}.")
-            current_status = _STATUS_VALS["INVALID"]
-        elif doc_code != "0" and doc_code not in docs_map:
-            log_browser(instance_id, f"Invalid Doc Code {doc_code} for {phone}.")
-            current_status = _STATUS_VALS["INVALID"]
-        elif media_code != "0" and media_code not in media_map:
-            log_browser(instance_id, f"Invalid Media Code {media_code} for {phone}.")
+        if contact.invalid_code:
+            log_browser(instance_id, invalid_contact_message(contact))
             current_status = _STATUS_VALS["INVALID"]
         elif not (has_message or has_docs or has_media):
             log_browser(instance_id, f"No actions for {phone}. Marking SENT.")
@@ -1388,32 +2867,32 @@ def process_contact(
 
         # If already invalid/sent, record and exit
         if current_status != _STATUS_VALS["RETRY"]:
-            with status_update_lock:
-                final_statuses[phone] = current_status
+            status_queue.put((phone, current_status))
             return
 
         # --- Perform Actions ---
         message_sent_status = "SKIPPED"
         docs_sent  = True
         media_sent = True
+        chat_ready = False # Set once an action leaves this contact's chat open
 
         # 1) Send text
         if has_message:
             log_browser(instance_id,
                         f"Processing {phone}... Sending msg (Code: {msg_code})")
-            min_t = float(settings.get("MIN_TIMER", "2.0"))
-            max_t = float(settings.get("MAX_TIMER", "5.0"))
-            time.sleep(random.uniform(min_t, max_t))
-
             message_sent_status = send_text_message(
                 driver, phone, message_template,
-                contact_details, instance_id,
-                settings, custom_placeholders
+                contact.details, instance_id,
+                settings, custom_placeholders,
+                rendered_message=contact.rendered_message,
+                pacer=pacer,
+                locators=send_locators
             )
 
             if stop_event.is_set():
                 return
 
+            chat_ready = message_sent_status == "SENT"
             if message_sent_status == "INVALID":
                 current_status = _STATUS_VALS["INVALID"]
                 docs_sent = False
@@ -1423,20 +2902,21 @@ def process_contact(
                 docs_sent = False
                 media_sent = False
 
-        # 2) Optionally wait before attachments
-        elif has_docs or has_media:
-            time.sleep(random.uniform(1.0, 2.0))
-
-        # 3) Attach documents
+        # 2) Attach documents (attach waits for the pacer's send deadline before clicking send)
         if has_docs and docs_sent:
-            valid_doc_files = docs_map.get(doc_code, [])
+            valid_doc_files = contact.doc_files
             if valid_doc_files:
                 log_browser(instance_id,
                             f"Attaching {len(valid_doc_files)} docs for {phone} (Code: {doc_code})...")
-                docs_sent = attach_and_send_files(
+                docs_status = attach_and_send_files(
                     driver, phone, valid_doc_files, "DOCS",
-                    instance_id, settings
+                    instance_id, settings, pacer, skip_navigation=chat_ready, locators=send_locators,
+                    await_close=has_media # The media attach menu needs the docs preview closed first
                 )
+                docs_sent = docs_status == "SENT"
+                chat_ready = docs_sent
+                if docs_status == "INVALID":
+                    current_status = _STATUS_VALS["INVALID"]
             else:
                 log_browser(instance_id,
                             f"Skipping docs: Code '{doc_code}' has no valid files.")
@@ -1445,19 +2925,23 @@ def process_contact(
             if stop_event.is_set():
                 return
             if not docs_sent:
-                current_status = _STATUS_VALS["RETRY"]
                 media_sent = False
 
-        # 4) Attach media
+        # 3) Attach media
         if has_media and media_sent:
-            valid_media_files = media_map.get(media_code, [])
+            valid_media_files = contact.media_files
             if valid_media_files:
                 log_browser(instance_id,
                             f"Attaching {len(valid_media_files)} media for {phone} (Code: {media_code})...")
-                media_sent = attach_and_send_files(
+                media_status = attach_and_send_files(
                     driver, phone, valid_media_files, "MEDIA",
-                    instance_id, settings
+                    instance_id, settings, pacer, skip_navigation=chat_ready, locators=send_locators,
+                    await_close=False
                 )
+                media_sent = media_status == "SENT"
+                chat_ready = media_sent
+                if media_status == "INVALID":
+                    current_status = _STATUS_VALS["INVALID"]
             else:
                 log_browser(instance_id,
                             f"Skipping media: Code '{media_code}' has no valid files.")
@@ -1465,59 +2949,114 @@ def process_contact(
 
             if stop_event.is_set():
                 return
-            if not media_sent:
-                current_status = _STATUS_VALS["RETRY"]
 
-        # 5) Final status decision
+        # 4) Final status decision
         if (message_sent_status != "FAILED"
             and docs_sent
             and media_sent
             and current_status == _STATUS_VALS["RETRY"]):
+            # Text and attachment uploads were pipelined; confirm them all at once before leaving the chat
+            if chat_ready and not wait_for_outgoing(driver, send_locators):
+                log_browser(instance_id, f"Some messages to {phone} were still pending after {_OUTGOING_CONFIRM_MS // 1000}s.")
             log_browser(instance_id, f"Successfully processed {phone}.")
             current_status = _STATUS_VALS["SENT"]
         elif current_status == _STATUS_VALS["RETRY"]:
             log_browser(instance_id, f"Marking {phone} for retry.")
 
-        with status_update_lock:
-            final_statuses[phone] = current_status
+        status_queue.put((phone, current_status))
 
     except WebDriverException as wd_err:
         log_browser(instance_id,
                     f"WebDriverException processing {phone}: {wd_err}. Retrying.")
         logging.exception(f"WD Traceback ({instance_id}, {phone}):")
         current_status = _STATUS_VALS["RETRY"]
-        with status_update_lock:
-            final_statuses[phone] = current_status
+        status_queue.put((phone, current_status))
 
     except Exception as e:
         log_browser(instance_id,
                     f"Unexpected error processing {phone}: {e}. Retrying.")
         logging.exception(f"Processing Traceback ({instance_id}, {phone}):")
         current_status = _STATUS_VALS["RETRY"]
-        with status_update_lock:
-            final_statuses[phone] = current_status
+        status_queue.put((phone, current_status))
+
+class BackgroundTasks:
+    """
+    Long-lived daemon threads for the GUI's one-shot jobs (Excel import, browser launch/quit, codec), reused
+    across button presses instead of starting a thread per job. Unlike ThreadPoolExecutor workers they are daemon
+    threads, so a browser call that hangs never blocks exit.
+    """
+    def __init__(self, max_workers: int, name: str) -> None:
+        self.max_workers = max_workers
+        self.name = name
+        self._tasks: "queue.SimpleQueue[Tuple[Future, Any, Tuple[Any, ...]]]" = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._threads = 0
+        self._idle = 0 # Threads waiting for a task that no submit() has claimed yet
+
+    def submit(self, fn: Any, *args: Any) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._idle:
+                self._idle -= 1
+            elif self._threads < self.max_workers:
+                self._threads += 1
+                threading.Thread(target=self._work, daemon=True, name=f"{self.name}-{self._threads}").start()
+        self._tasks.put((future, fn, args))
+        return future
+
+    def _work(self) -> None:
+        while True:
+            future, fn, args = self._tasks.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+            with self._lock:
+                self._idle += 1
 
 # --- PySide6 GUI Implementation ---
 class WhatsAppBlasterGUI(QMainWindow):
     def __init__(self):
         super().__init__()
         self.excel_file: Optional[str] = None
-        self.settings: Dict[str, Any] = {}
-        self.browsers_map: Dict[str, List[str]] = {} # <-- Store browser map here too
+        self.settings: Mapping[str, Any] = {}
+        self.browsers_map: Mapping[str, List[str]] = {} # <-- Store browser map here too
         self.headless_mode = False
         # ... (rest of __init__ remains the same) ...
         self.signals = Signals()
         global global_signals
         global_signals = self.signals
         self.final_statuses: Dict[str, int] = {}
+        self.phone_row_index: Optional[Dict[str, List[int]]] = None
+        self.status_workbook: Optional[StatusWorkbook] = None
+        # One long-lived writer: saves from the runner, the periodic flush and shutdown queue up instead of racing
+        self.save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="BatchUpdate")
+        self.background_tasks = BackgroundTasks(max_workers=8, name="GuiTask")
+        # Save requests merge into _pending_statuses; at most one save waits behind the running one (_request_save)
+        self._save_lock = threading.Lock()
+        self._pending_statuses: Dict[str, int] = {}
+        # Every status already handed to a save this run; flushes only write the ones that differ from it
+        self._requested_statuses: Dict[str, int] = {}
+        self._save_future: Optional[Future] = None
         self.status_update_lock = threading.Lock()
-        self.total_processed_count = 0
-        self.browser_manager_1 = BrowserManager(instance_id=1)
-        self.browser_manager_2 = BrowserManager(instance_id=2)
+        # Workers only put (phone, status) here; _drain_status_queue applies them to final_statuses before a save
+        self.status_queue: "queue.SimpleQueue[Tuple[str, int]]" = queue.SimpleQueue()
+        self.status_journal: Optional[StatusJournal] = None # Per run; workers put results through it
+        self.progress_counter = itertools.count(1) # next() is atomic under the GIL; no lock needed per contact
+        self.browser_pool = BrowserPool(size=2)
         self.processing_thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
         self.init_ui()
         self.connect_signals()
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setInterval(_LOG_FLUSH_INTERVAL_MS)
+        self.log_flush_timer.timeout.connect(flush_log_queue)
+        self.log_flush_timer.start()
+        self.status_flush_timer = QTimer(self)
+        self.status_flush_timer.setInterval(_STATUS_FLUSH_INTERVAL_MS)
+        self.status_flush_timer.timeout.connect(self._periodic_status_flush)
+        self.status_flush_timer.start()
         log_system("Application initialized.")
 
     def init_ui(self):
@@ -1591,19 +3130,21 @@ class WhatsAppBlasterGUI(QMainWindow):
         log_layout = QVBoxLayout(log_group)
         log_layout.setSpacing(5)
         log_layout.addWidget(QLabel("System Logs:"))
-        self.sys_log = QTextEdit()
+        self.sys_log = QPlainTextEdit() # Plain text: no rich-text parsing per batch, line-based layout
         self.sys_log.setReadOnly(True)
         self.sys_log.setFixedHeight(100)
         log_layout.addWidget(self.sys_log)
         log_layout.addWidget(QLabel("Browser 1 Logs:"))
-        self.b1_log = QTextEdit()
+        self.b1_log = QPlainTextEdit()
         self.b1_log.setReadOnly(True)
         self.b1_log.setFixedHeight(100)
         log_layout.addWidget(self.b1_log)
         log_layout.addWidget(QLabel("Browser 2 Logs:"))
-        self.b2_log = QTextEdit(); self.b2_log.setReadOnly(True)
+        self.b2_log = QPlainTextEdit(); self.b2_log.setReadOnly(True)
         self.b2_log.setFixedHeight(100)
         log_layout.addWidget(self.b2_log)
+        for log_view in (self.sys_log, self.b1_log, self.b2_log):
+            log_view.document().setMaximumBlockCount(_LOG_MAX_LINES)
         main_layout.addWidget(log_group)
         main_layout.addStretch()
 
@@ -1624,7 +3165,7 @@ class WhatsAppBlasterGUI(QMainWindow):
             QPushButton:pressed { background-color: #444444; }
             QPushButton:disabled { background-color: #444444; color: #888888; border: 1px solid #555555;}
             QLineEdit { background-color: #444444; color: white; border: 1px solid #555555; border-radius: 4px; padding: 4px; }
-            QTextEdit { background-color: #2B2B2B; color: #A9B7C6; border: 1px solid #444444; border-radius: 4px; font-family: Consolas, monospace; }
+            QTextEdit, QPlainTextEdit { background-color: #2B2B2B; color: #A9B7C6; border: 1px solid #444444; border-radius: 4px; font-family: Consolas, monospace; }
             QCheckBox { color: white; spacing: 5px; }
             QCheckBox::indicator { width: 16px; height: 16px; border-radius: 3px; }
             QCheckBox::indicator:unchecked { background-color: #555; border: 1px solid #666; }
@@ -1646,23 +3187,28 @@ class WhatsAppBlasterGUI(QMainWindow):
         self.btn_clear_cache.clicked.connect(self.delete_temp_folders)
         self.chk_headless.toggled.connect(self.toggle_headless)
         # Custom Signals
-        self.signals.log_system_signal.connect(self.append_sys_log)
-        self.signals.log_browser1_signal.connect(self.append_b1_log)
-        self.signals.log_browser2_signal.connect(self.append_b2_log)
+        self.signals.log_system_batch_signal.connect(self.append_sys_log)
+        self.signals.log_browser1_batch_signal.connect(self.append_b1_log)
+        self.signals.log_browser2_batch_signal.connect(self.append_b2_log)
         self.signals.processing_started.connect(self.on_processing_started)
         self.signals.processing_stopped.connect(self.on_processing_stopped)
         self.signals.update_progress.connect(self.update_progress_bar)
-
-    def append_sys_log(self, text: str):
-        self.sys_log.append(text)
+        self.signals.excel_loaded.connect(self._on_excel_loaded)
+        self.signals.excel_load_failed.connect(self._on_excel_load_failed)
+        self.signals.codec_done.connect(self._on_codec_done)
+        self.signals.codec_failed.connect(self._on_codec_failed)
+        self.signals.show_message.connect(self._show_message)
+
+    def append_sys_log(self, lines: List[str]):
+        self.sys_log.appendPlainText("\n".join(lines))
         self.sys_log.verticalScrollBar().setValue(self.sys_log.verticalScrollBar().maximum())
 
-    def append_b1_log(self, text: str):
-        self.b1_log.append(text)
+    def append_b1_log(self, lines: List[str]):
+        self.b1_log.appendPlainText("\n".join(lines))
         self.b1_log.verticalScrollBar().setValue(self.b1_log.verticalScrollBar().maximum())
 
-    def append_b2_log(self, text: str):
-        self.b2_log.append(text)
+    def append_b2_log(self, lines: List[str]):
+        self.b2_log.appendPlainText("\n".join(lines))
         self.b2_log.verticalScrollBar().setValue(self.b2_log.verticalScrollBar().maximum())
 
     # Progress Bar Slot
@@ -1683,35 +3229,80 @@ class WhatsAppBlasterGUI(QMainWindow):
             self.excel_file = path
             self.excel_path_display.setText(path)
             log_system(f"Selected Excel file: {path}")
-            if not self.load_settings():
-                self.excel_file = None
-                self.excel_path_display.clear()
+            self.load_settings_async()
+
+    @staticmethod
+    def _read_settings(excel_file: str) -> Tuple[Mapping[str, Any], Mapping[str, List[str]]]:
+        """
+        Runs the full loader (including Google Drive downloads) and returns (settings, browsers_map) as read-only views,
+        so they can be handed to worker threads without copying.
+        """
+        log_system(f"Loading data and settings from {excel_file}...")
+        loader = ExcelDataLoader.load(excel_file)
+        settings = loader.get_settings()
+        browsers_map = loader.get_browsers_map()
+        # Perform checks after loading
+        if loader.get_contacts().empty:
+            log_system("Warning: LIST sheet empty or failed to load during settings check.")
+        if not settings:
+            log_system("SETTINGS sheet missing or failed, using defaults.")
+        if not browsers_map:
+            log_system("Warning: BROWSER sheet failed to load or is empty. Browser setup might fail.")
+        log_system("Settings and browser data loaded successfully.")
+        return MappingProxyType(settings), MappingProxyType(browsers_map)
 
     def load_settings(self) -> bool:
         if not self.excel_file:
             log_system("Cannot load settings: No Excel file selected.")
             return False
         try:
-            log_system(f"Loading data and settings from {self.excel_file}...")
-            loader = ExcelDataLoader(self.excel_file)
-            self.settings = loader.get_settings()
-            self.browsers_map = loader.get_browsers_map()
-            # Perform checks after loading
-            if loader.get_contacts().empty:
-                log_system("Warning: LIST sheet empty or failed to load during settings check.")
-            if not self.settings:
-                log_system("SETTINGS sheet missing or failed, using defaults.")
-            if not self.browsers_map:
-                log_system("Warning: BROWSER sheet failed to load or is empty. Browser setup might fail.")
-            log_system("Settings and browser data loaded successfully.")
+            self.settings, self.browsers_map = self._read_settings(self.excel_file)
             return True
         except Exception as e:
-            QMessageBox.critical(self, "Error Loading Excel", f"Failed to load data/settings from Excel:\n{e}")
-            log_system(f"Critical error loading Excel data: {e}")
-            self.settings = {}
-            self.browsers_map = {}
+            self._report_excel_load_error(str(e))
             return False
 
+    def load_settings_async(self) -> None:
+        """Loads settings on a worker thread so Drive downloads don't freeze the window; results arrive via signals."""
+        excel_file = self.excel_file
+        for button in (self.btn_import, self.btn_launch, self.btn_run):
+            button.setEnabled(False)
+
+        def load():
+            try:
+                settings, browsers_map = self._read_settings(excel_file)
+                self.signals.excel_loaded.emit(excel_file, settings, browsers_map)
+            except Exception as e:
+                self.signals.excel_load_failed.emit(excel_file, str(e))
+
+        self.background_tasks.submit(load)
+
+    def _on_excel_loaded(self, excel_file: str, settings: Dict[str, Any], browsers_map: Dict[str, List[str]]):
+        for button in (self.btn_import, self.btn_launch, self.btn_run):
+            button.setEnabled(True)
+        if excel_file != self.excel_file:
+            return # A different file was selected meanwhile
+        self.settings = settings
+        self.browsers_map = browsers_map
+
+    def _on_excel_load_failed(self, excel_file: str, error: str):
+        for button in (self.btn_import, self.btn_launch, self.btn_run):
+            button.setEnabled(True)
+        if excel_file != self.excel_file:
+            return
+        self._report_excel_load_error(error)
+        self.excel_file = None
+        self.excel_path_display.clear()
+
+    def _show_message(self, level: str, title: str, text: str):
+        (QMessageBox.critical if level == "critical" else QMessageBox.warning)(self, title, text)
+
+    def _report_excel_load_error(self, error: str):
+        QMessageBox.critical(self, "Error Loading Excel", f"Failed to load data/settings from Excel:\n{error}")
+        log_system(f"Critical error loading Excel data: {error}")
+        self.settings = {}
+        self.browsers_map = {}
+
     def download_template(self):
         template_filename = "Template.xlsx"
         try:
@@ -1761,20 +3352,23 @@ class WhatsAppBlasterGUI(QMainWindow):
                     current_url = ""
                     try: current_url = driver.current_url
                     except WebDriverException: log_browser(instance_id, "Browser seems to have closed."); return
-                    if "web.whatsapp.com" not in current_url: driver.get("https://web.whatsapp.com")
+                    if "web.whatsapp.com" not in current_url: navigate(driver, "https://web.whatsapp.com")
                     log_browser(instance_id, "Browser launched. Ready for QR scan or already logged in.")
                 except WebDriverException as e: log_browser(instance_id, f"Error navigating to WhatsApp Web: {e}")
             else: log_browser(instance_id, "Failed to launch browser.")
 
         # Start threads, passing the maps
-        threading.Thread(target=launch, args=(1, self.settings.copy(), self.browser_manager_1, self.browsers_map.copy()), daemon=True, name="LaunchThread-1").start()
-        threading.Thread(target=launch, args=(2, self.settings.copy(), self.browser_manager_2, self.browsers_map.copy()), daemon=True, name="LaunchThread-2").start()
+        pool_size = browser_pool_size(self.settings)
+        self.browser_pool.resize(pool_size)
+        for manager in self.browser_pool.managers[:pool_size]:
+            self.background_tasks.submit(launch, manager.instance_id, self.settings, manager, self.browsers_map)
     
-    def quit_browsers(self):
+    def quit_browsers(self) -> Future:
+        """Quits the pool's browsers in the background; wait on the returned future to wait for them."""
         log_system("Quitting browser instances...")
-        threading.Thread(target=self.browser_manager_1.quit, daemon=True).start()
-        threading.Thread(target=self.browser_manager_2.quit, daemon=True).start()
+        quit_future = self.background_tasks.submit(self.browser_pool.quit_all)
         log_system("Browser quit commands issued.")
+        return quit_future
 
     def run_blaster(self):
         if not self.excel_file:
@@ -1795,13 +3389,21 @@ class WhatsAppBlasterGUI(QMainWindow):
 
         log_system("--- Starting Blaster ---")
         self.stop_event.clear()
+        self._wait_for_saves(30.0) # The previous run's last save still uses its row index and workbook
+        self.phone_row_index = None
+        if self.status_workbook: self.status_workbook.close()
+        self.status_workbook = None
         self.final_statuses.clear()
-        self.total_processed_count = 0
+        with self._save_lock:
+            self._requested_statuses.clear()
+        self.status_queue = queue.SimpleQueue()
+        self.status_journal = StatusJournal(self.excel_file, self.status_queue) # Opens its file on the first result
+        self.progress_counter = itertools.count(1)
 
         # Pass the core settings and browser map. _processing_runner will handle loading run-specific data.
         self.processing_thread = threading.Thread(
             target=self._processing_runner,
-            args=(self.excel_file, self.settings.copy(), self.browsers_map.copy(), self.headless_mode),
+            args=(self.excel_file, self.settings, self.browsers_map, self.headless_mode),
             daemon=True, name="BlasterRunner"
         )
         self.processing_thread.start()
@@ -1813,10 +3415,11 @@ class WhatsAppBlasterGUI(QMainWindow):
                                  messages_map: Dict[str, str],
                                  docs_map: Dict[str, List[str]],
                                  media_map: Dict[str, List[str]],
-                                 driver1: Optional[WebDriver],
-                                 driver2: Optional[WebDriver],
+                                 managers: List[BrowserManager],
                                  settings: Dict[str, Any],
-                                 custom_placeholders: Dict[str, str]) -> None:
+                                 custom_placeholders: Dict[str, str],
+                                 headless: bool,
+                                 browsers_map: Dict[str, List[str]]) -> None:
         """
         Executes a single processing phase (e.g., Initial, Retry).
         """
@@ -1833,25 +3436,25 @@ class WhatsAppBlasterGUI(QMainWindow):
         # (initial vs retry) is up to the calling logic in _processing_runner.
         # This function assumes drivers passed to it are ready or None.
 
-        if not driver1 and not driver2:
+        if not managers:
             log_system(f"Cannot start {phase_name} phase: No active browser drivers.")
             # Mark all contacts in this phase for retry if no drivers are available
-            with self.status_update_lock:
-                for _, contact_row in contacts_for_phase.iterrows():
-                    phone = normalize_value(contact_row.get(_LIST_COLS["phone"]))
-                    if phone:
-                        self.final_statuses[phone] = _STATUS_VALS["RETRY"]
+            phone_col = _LIST_COLS["phone"]
+            if phone_col in contacts_for_phase.columns:
+                phones = contacts_for_phase[phone_col]
+                with self.status_update_lock:
+                    self.final_statuses.update(dict.fromkeys(phones[phones != ""], _STATUS_VALS["RETRY"]))
             self._save_pending_updates() # Save the retry statuses
             return
 
+        self._drain_status_queue() # Nothing from an earlier phase may land in this one
         self.final_statuses.clear() # Clear for the current phase
-        self.total_processed_count = 0 # Reset for the current phase
+        self.progress_counter = itertools.count(1) # Reset for the current phase
 
-        contacts_list = [row for _, row in contacts_for_phase.iterrows()]
+        contacts_list = build_contact_tasks(contacts_for_phase, messages_map, docs_map, media_map, custom_placeholders)
 
-        self._run_phase(contacts_list, messages_map, docs_map, media_map,
-                        driver1, driver2, settings, phase_name,
-                        total_to_process_for_phase, custom_placeholders)
+        self._run_phase(contacts_list, managers, settings, phase_name,
+                        total_to_process_for_phase, custom_placeholders, headless, browsers_map)
 
         log_system(f"Saving {phase_name} results...")
         self._save_pending_updates()
@@ -1861,12 +3464,13 @@ class WhatsAppBlasterGUI(QMainWindow):
     def _processing_runner(self, excel_file: str, settings: Dict[str,Any], browsers_map: Dict[str,List[str]], headless: bool):
         """Main runner function executed in a separate thread."""
         loader = None
-        driver1: Optional[WebDriver] = None
-        driver2: Optional[WebDriver] = None
 
         try:
+            self._recover_journal_statuses(excel_file, settings)
             log_system("Loading data for run...")
-            loader = ExcelDataLoader(excel_file) # Load all data fresh for the run
+            loader = ExcelDataLoader.load(excel_file) # Reuses the settings check's load if the file is unchanged
+            self.phone_row_index = loader.get_phone_row_index()
+            self.status_workbook = loader.get_status_workbook() # Kept for the whole run, including the retry phase
             
             # Load all data needed for the entire run (initial + retry)
             contacts_df_full = loader.get_contacts()
@@ -1881,7 +3485,7 @@ class WhatsAppBlasterGUI(QMainWindow):
 
             if contacts_df_full.empty:
                 log_system("Run cancelled: LIST sheet in Excel is empty or failed to load.")
-                QMessageBox.warning(None, "No Contacts", "The LIST sheet in your Excel file is empty or could not be loaded.")
+                self.signals.show_message.emit("warning", "No Contacts", "The LIST sheet in your Excel file is empty or could not be loaded.")
                 self.signals.processing_stopped.emit()
                 return
 
@@ -1890,28 +3494,22 @@ class WhatsAppBlasterGUI(QMainWindow):
 
             # --- Setup Browsers Once ---
             log_system("Setting up browsers for the run...")
-            # Ensure browsers are quit before starting a new run, if they were left open from a previous action.
-            # This is a good practice to ensure a clean state.
-            self.browser_manager_1.quit()
-            self.browser_manager_2.quit()
-            time.sleep(1) # Give a moment for browsers to close
-
-            driver1 = self.browser_manager_1.setup_browser(headless, settings, browsers_map)
-            driver2 = self.browser_manager_2.setup_browser(headless, settings, browsers_map)
+            # Live sessions (e.g. from 'Launch WA Web' or a previous run) are reused; only missing ones are started
+            live_managers = self._warm_browsers(headless, settings, browsers_map)
 
-            if not driver1 and not driver2:
+            if not live_managers:
                 log_system("Failed to start ANY browser drivers. Aborting run.")
-                QMessageBox.critical(None, "Browser Error", "Could not start any browser instances. Please check settings and browser installations.")
+                self.signals.show_message.emit("critical", "Browser Error", "Could not start any browser instances. Please check settings and browser installations.")
                 self.signals.processing_stopped.emit()
                 return
-            if not driver1: log_system("Warning: Browser Instance 1 failed to start.")
-            if not driver2: log_system("Warning: Browser Instance 2 failed to start.")
 
             # --- Initial Processing Phase ---
-            initial_contacts_df = contacts_df_full[contacts_df_full[status_col].isin([status_pending, status_retry])].copy()
+            # Phase frames are only read (build_contact_tasks builds its own records), so no .copy()
+            initial_contacts_df = contacts_df_full[contacts_df_full[status_col].isin([status_pending, status_retry])]
             self._execute_processing_phase("Initial", initial_contacts_df,
                                            messages_map, docs_map, media_map,
-                                           driver1, driver2, settings, custom_placeholders)
+                                           live_managers, settings, custom_placeholders,
+                                           headless, browsers_map)
 
             if self.stop_event.is_set():
                 log_system("Processing stopped after initial phase.")
@@ -1919,34 +3517,37 @@ class WhatsAppBlasterGUI(QMainWindow):
                 return
 
             # --- Retry Processing Phase ---
-            log_system("Reloading contact statuses for retry phase...")
-            # It's crucial to reload the Excel to get the statuses that were just updated by perform_batch_update
-            # This ensures we're retrying based on the latest saved state.
-            loader_for_retry = ExcelDataLoader(excel_file)
-            contacts_df_for_retry_full = loader_for_retry.get_contacts() # Get fresh contacts including updated statuses
+            # The initial phase's statuses are still in memory and were just saved, so the retry set comes from them.
+            # The Excel is only reloaded if something else modified it meanwhile.
+            self._wait_for_saves(30.0) # Our own save must land first, or it would look like an outside change
+            if self.status_workbook is None or self.status_workbook.changed_on_disk():
+                log_system("Reloading contact statuses for retry phase...")
+                with self._save_lock:
+                    self._requested_statuses.clear() # The file may no longer hold what we saved
+                loader_for_retry = ExcelDataLoader.load(excel_file)
+                contacts_df_for_retry_full = loader_for_retry.get_contacts() # Get fresh contacts including updated statuses
+                self.phone_row_index = loader_for_retry.get_phone_row_index()
+                if not contacts_df_for_retry_full.empty:
+                    retry_mask = contacts_df_for_retry_full[status_col] == status_retry
+            else:
+                # Saves write a phone's status to all of its rows, so match rows by phone like the reload would
+                initial_statuses = self._drain_status_queue()
+                retry_phones = [phone for phone, status in initial_statuses.items() if status == status_retry]
+                contacts_df_for_retry_full = contacts_df_full
+                retry_mask = contacts_df_full[_LIST_COLS["phone"]].isin(retry_phones)
 
             if contacts_df_for_retry_full.empty:
                 log_system("Retry phase skipped: LIST sheet in Excel is empty or failed to load for retry.")
             else:
-                retry_contacts_df = contacts_df_for_retry_full[contacts_df_for_retry_full[status_col] == status_retry].copy()
+                retry_contacts_df = contacts_df_for_retry_full[retry_mask]
                 
-                # Re-validate drivers before retry phase. They might have crashed.
-                # No need to fully re-setup unless _get_valid_driver indicates they are gone.
-                # If a driver crashed, it will be None.
-                current_driver1 = self._get_valid_driver(self.browser_manager_1)
-                current_driver2 = self._get_valid_driver(self.browser_manager_2)
-
-                # Optional: If you want to attempt re-setup if a driver crashed:
-                if driver1 and not current_driver1:
-                    log_system("Browser 1 seems to have disconnected. Attempting to restart for retry phase...")
-                    current_driver1 = self.browser_manager_1.setup_browser(headless, settings, browsers_map)
-                if driver2 and not current_driver2:
-                    log_system("Browser 2 seems to have disconnected. Attempting to restart for retry phase...")
-                    current_driver2 = self.browser_manager_2.setup_browser(headless, settings, browsers_map)
+                # Re-validate drivers before retry phase. They might have crashed; warm() restarts those.
+                live_managers = self._warm_browsers(headless, settings, browsers_map)
 
                 self._execute_processing_phase("Retry", retry_contacts_df,
                                                messages_map, docs_map, media_map,
-                                               current_driver1, current_driver2, settings, custom_placeholders)
+                                               live_managers, settings, custom_placeholders,
+                                               headless, browsers_map)
 
             log_system("--- Blaster Run Finished ---")
 
@@ -1956,113 +3557,226 @@ class WhatsAppBlasterGUI(QMainWindow):
             # Attempt to save any statuses that might have been collected before the error
             self._save_pending_updates()
         finally:
-            # Ensure browsers are quit eventually, e.g. if user stops or run finishes
-            # self.browser_manager_1.quit() # Or quit them at the very end of the application
-            # self.browser_manager_2.quit()
+            journal = self.status_journal
+            if journal:
+                # Kept for the next run if a save failed or is still running
+                saved = self._wait_for_saves(30.0) and not self._pending_statuses
+                journal.discard() if saved else journal.close()
+            # Browsers stay open for the next run; they are quit via 'Quit Browsers' or on exit
             self.signals.processing_stopped.emit()
 
+    def _recover_journal_statuses(self, excel_file: str, settings: Dict[str, Any]) -> None:
+        """Saves the statuses an earlier run journaled but never wrote to the workbook (e.g. it crashed)."""
+        leftover = StatusJournal.read(excel_file)
+        if not leftover:
+            return
+        log_system(f"Recovering {len(leftover)} statuses from an unfinished run...")
+        fast_rewrite = is_truthy_setting(settings.get(_SETTINGS_COLS["fast_save"]))
+        if perform_batch_update(excel_file, leftover, fast_rewrite):
+            try: os.remove(StatusJournal.journal_path(excel_file))
+            except OSError as e: log_system(f"Warning: Could not remove status journal: {e}")
+        else:
+            log_system("Warning: Recovered statuses could not be saved yet; retrying with this run's saves.")
+            with self._save_lock: # This run's newer statuses for the same phones win
+                self._pending_statuses = {**leftover, **self._pending_statuses}
+
+    def _warm_browsers(self, headless: bool, settings: Dict[str, Any], browsers_map: Dict[str, List[str]]) -> List[BrowserManager]:
+        """Starts (or reuses) BROWSER_POOL_SIZE instances and returns the managers that are running."""
+        pool_size = browser_pool_size(settings)
+        self.browser_pool.resize(pool_size)
+        drivers = self.browser_pool.warm(headless, settings, browsers_map, pool_size)
+        live_managers = []
+        for manager, driver in zip(self.browser_pool.managers, drivers):
+            if driver:
+                live_managers.append(manager)
+            else:
+                log_system(f"Warning: Browser Instance {manager.instance_id} failed to start.")
+        return live_managers
+
     def _run_phase(self, 
-                   contacts_list: List[pd.Series],
-                   messages_map: Dict,
-                   docs_map: Dict,
-                   media_map: Dict,
-                   driver1: Optional[WebDriver],
-                   driver2: Optional[WebDriver],
+                   contacts_list: List[ContactTask],
+                   managers: List[BrowserManager],
                    settings: Dict,
                    phase_name: str,
                    total_for_phase: int,
-                   custom_placeholders: Dict[str, str]):
+                   custom_placeholders: Dict[str, str],
+                   headless: bool,
+                   browsers_map: Dict[str, List[str]]):
 
-        """Runs processing phase, passing custom_placeholders to workers."""
+        """Runs processing phase: each contact checks a browser out of the pool, is processed, and returns it."""
         if not contacts_list: log_system(f"{phase_name} skipped: No contacts."); return
-        q1, q2 = queue.Queue(), queue.Queue()
-        for i, contact in enumerate(contacts_list):
-            assigned=False
-            phone = contact.get(_LIST_COLS['phone'], 'Unk')
-
-            if i % 2 == 0 and driver1:
-                q1.put(contact)
-                assigned = True
-            elif driver2:
-                q2.put(contact)
-                assigned = True
-            elif driver1:
-                q1.put(contact)
-                assigned = True
-            if not assigned:
-                log_system(f"Err assign: {phone}")
-            with self.status_update_lock:
-                self.final_statuses[phone] = _STATUS_VALS["RETRY"]
-        log_system(f"{phase_name}: Q1={q1.qsize()}, Q2={q2.qsize()}.")
-
-        def browser_worker(instance_id, driver, contact_q): # Passes custom_placeholders to process_contact
-            if not driver: return
-            log_browser(instance_id, f"{phase_name} worker started.")
-            while not contact_q.empty() and not self.stop_event.is_set():
-                contact = None # Define contact outside try for except blocks
+        retry_status = _STATUS_VALS["RETRY"]
+        # Built in one call (sized once, no rehashing as it grows) outside the lock; only the swap is locked
+        prefilled = dict.fromkeys((contact.phone for contact in contacts_list if contact.phone), retry_status)
+        with self.status_update_lock:
+            self.final_statuses = prefilled # Replaces the dict _execute_processing_phase just cleared
+        message_delay = message_delay_bounds(settings)
+        for manager in managers:
+            manager.prepare_locators(settings)
+            manager.pacer.message_delay = message_delay
+        self.browser_pool.check_in(managers)
+        log_system(f"{phase_name}: {len(contacts_list)} contacts over {len(managers)} browser(s).")
+
+        # One shared queue drained by a worker per browser: whichever browser is free takes the next contact
+        work_queue: "queue.SimpleQueue[ContactTask]" = queue.SimpleQueue()
+        progress = {"count": 0, "emitted_at": 0.0} # Progress signals are coalesced to one per _PROGRESS_EMIT_INTERVAL_S
+        # Bound once for the per-contact loop below
+        stop_event, status_queue, pool = self.stop_event, self.status_journal, self.browser_pool
+        progress_counter, emit_progress = self.progress_counter, self.signals.update_progress.emit
+        # Contacts that are invalid before any browser work (bad number, undefined code) never check out a browser
+        invalid_status = _STATUS_VALS["INVALID"]
+        for contact in contacts_list:
+            if contact.invalid_code and contact.phone:
+                log_system(f"{phase_name}: {invalid_contact_message(contact)}")
+                status_queue.put((contact.phone, invalid_status))
+                progress["count"] = next(progress_counter)
+            else:
+                work_queue.put(contact)
+
+        def browser_worker(): # Passes custom_placeholders to process_contact
+            while not stop_event.is_set():
+                try:
+                    contact = work_queue.get_nowait()
+                except queue.Empty:
+                    return
+                manager = pool.acquire(stop_event)
+                if manager is None: return # Stopped, or no browser left; remaining contacts stay RETRY
+                instance_id = manager.instance_id
                 try:
-                    contact = contact_q.get_nowait()
-                    process_contact(driver, contact, messages_map, docs_map, media_map, instance_id, settings, self.stop_event, self.final_statuses, self.status_update_lock, custom_placeholders) # Pass custom_placeholders
-                    contact_q.task_done()
-                    with self.status_update_lock: self.total_processed_count += 1; current_count = self.total_processed_count
-                    self.signals.update_progress.emit(current_count, total_for_phase)
-                except queue.Empty: break
-                except WebDriverException as e:
-                    phone = contact.get(_LIST_COLS['phone'], 'Unk') if contact is not None else 'Unk'
-                    log_browser(instance_id, f"WD Exc {phase_name} for {phone}: {e}. Retrying.")
-                    with self.status_update_lock: self.final_statuses[phone] = _STATUS_VALS["RETRY"]
-                    with self.status_update_lock: self.total_processed_count += 1; current_count = self.total_processed_count
-                    self.signals.update_progress.emit(current_count, total_for_phase)
-                    if "disconnected" in str(e) or "fail" in str(e): log_browser(instance_id, "Browser disconnected. Worker stop."); break
+                    process_contact(manager.driver, contact, instance_id, settings, stop_event, status_queue, custom_placeholders, manager.pacer, manager.send_locators) # Pass custom_placeholders
                 except Exception as e:
-                    phone = contact.get(_LIST_COLS['phone'], 'Unk') if contact is not None else 'Unk'
-                    log_browser(instance_id, f"Unexpected error {phase_name} for {phone}: {e}"); logging.exception(f"Worker Traceback ({instance_id}, {phase_name}):")
-                    with self.status_update_lock: self.final_statuses[phone] = _STATUS_VALS["RETRY"]
-                    with self.status_update_lock: self.total_processed_count += 1; current_count = self.total_processed_count
-                    self.signals.update_progress.emit(current_count, total_for_phase)
-            log_browser(instance_id, f"{phase_name} worker finished.")
-
-        thread1 = threading.Thread(target=browser_worker, args=(1, driver1, q1), daemon=True, name=f"Worker-1-{phase_name}") if driver1 else None
-        thread2 = threading.Thread(target=browser_worker, args=(2, driver2, q2), daemon=True, name=f"Worker-2-{phase_name}") if driver2 else None
-        if thread1: thread1.start(); 
-        if thread2: thread2.start()
-        if thread1: thread1.join()
-        if thread2: thread2.join()
+                    if stop_event.is_set(): # Its browser call was interrupted by the stop (see _join_workers)
+                        log_browser(instance_id, f"Stopped during {phase_name} for {contact.phone}. Left for retry.")
+                    elif isinstance(e, WebDriverException):
+                        log_browser(instance_id, f"WD Exc {phase_name} for {contact.phone}: {e}. Retrying.")
+                    else:
+                        log_browser(instance_id, f"Unexpected error {phase_name} for {contact.phone}: {e}"); logging.exception(f"Worker Traceback ({instance_id}, {phase_name}):")
+                    status_queue.put((contact.phone, retry_status))
+                finally:
+                    pool.release(manager, headless, settings, browsers_map)
+                current_count = next(progress_counter)
+                progress["count"] = max(progress["count"], current_count)
+                now = time.monotonic()
+                if current_count == total_for_phase or now - progress["emitted_at"] >= _PROGRESS_EMIT_INTERVAL_S:
+                    progress["emitted_at"] = now
+                    emit_progress(current_count, total_for_phase)
+
+        def run_worker():
+            try:
+                browser_worker()
+            except Exception as e:
+                log_system(f"{phase_name} worker stopped on an unexpected error: {e}")
+                logging.exception(f"Worker Traceback ({phase_name}):")
+
+        # Daemon threads joined with a timeout, so a browser call that hangs cannot block the stop path forever
+        workers = [threading.Thread(target=run_worker, daemon=True, name=f"Worker-{phase_name}-{i}")
+                   for i in range(1, len(managers) + 1)]
+        for worker in workers:
+            worker.start()
+        self._join_workers(workers)
+        if progress["count"]:
+            self.signals.update_progress.emit(progress["count"], total_for_phase) # The last count may have been coalesced away
         log_system(f"{phase_name} phase complete.")
 
-    def _get_valid_driver(self, manager: BrowserManager) -> Optional[WebDriver]:
-        if manager.driver:
-            try:
-                _ = manager.driver.window_handles
-                return manager.driver
-            except WebDriverException:
-                log_browser(manager.instance_id, "Driver disconnected.")
-                manager.driver = None
-                return None
-        return None
+    def _join_workers(self, workers: List[threading.Thread]) -> None:
+        """
+        Joins the phase workers, giving them _STOP_GRACE_S to finish their contact once a stop is requested. Browsers
+        still busy after that are interrupted, so workers blocked in a page load return (and record RETRY) right away.
+        """
+        while any(worker.is_alive() for worker in workers):
+            for worker in workers:
+                worker.join(timeout=0.25)
+            if self.stop_event.is_set():
+                deadline = time.monotonic() + _STOP_GRACE_S
+                for worker in workers:
+                    worker.join(timeout=max(0.0, deadline - time.monotonic()))
+                if any(worker.is_alive() for worker in workers) and self.browser_pool.interrupt_busy():
+                    deadline = time.monotonic() + _INTERRUPT_GRACE_S
+                    for worker in workers:
+                        worker.join(timeout=max(0.0, deadline - time.monotonic()))
+                stuck = [worker.name for worker in workers if worker.is_alive()]
+                if stuck:
+                    log_system(f"Still busy {_STOP_GRACE_S:.0f}s after stop, continuing without: {', '.join(stuck)}")
+                return
 
-    def _save_pending_updates(self):
+    def _drain_status_queue(self) -> Dict[str, int]:
+        """Applies queued worker results to final_statuses (in completion order) and returns a snapshot."""
+        with self.status_update_lock:
+            while True:
+                try:
+                    phone, status = self.status_queue.get_nowait()
+                except queue.Empty:
+                    break
+                self.final_statuses[phone] = status
+            return self.final_statuses.copy()
+
+    def _save_pending_updates(self, wait: bool = False):
+        """Queues a save of the collected statuses; only blocks (up to 30s) when wait is set, e.g. on exit."""
         if not self.excel_file:
             log_system("Cannot save updates: Excel file path not set.")
             return
 
-        with self.status_update_lock:
-            statuses_to_save = self.final_statuses.copy()
+        statuses_to_save = self._drain_status_queue()
 
         if not statuses_to_save:
             log_system("No pending status updates to save.")
-            return
-        
-        log_system(f"Attempting to save {len(statuses_to_save)} status updates...")
-        
-        save_thread = threading.Thread(target=perform_batch_update, args=(self.excel_file, statuses_to_save), daemon=True, name="BatchUpdateThread")
-        save_thread.start()
-        save_thread.join(timeout=30.0)
+        else:
+            log_system(f"Attempting to save {len(statuses_to_save)} status updates...")
+            self._request_save(statuses_to_save)
 
-        if save_thread.is_alive():
-            log_system("Warning: Batch update is taking a long time.")
+        if wait and not self._wait_for_saves(30.0):
             QMessageBox.warning(self, "Save Operation", "Saving Excel file is taking longer than expected.")
 
+    def _request_save(self, statuses_to_save: Dict[str, int]) -> Optional[Future]:
+        """
+        Merges the statuses that changed since they were last handed to a save into the next save, so each flush
+        writes only new results instead of every status collected so far. A new save is only queued if none is
+        already waiting to start.
+        """
+        with self._save_lock:
+            requested = self._requested_statuses
+            changed = {phone: status for phone, status in statuses_to_save.items() if requested.get(phone) != status}
+            requested.update(changed)
+            self._pending_statuses.update(changed)
+            future = self._save_future
+            if self._pending_statuses and (future is None or future.running() or future.done()):
+                future = self._save_future = self.save_executor.submit(self._flush_pending_statuses)
+            return future
+
+    def _flush_pending_statuses(self) -> bool:
+        with self._save_lock:
+            statuses_to_save, self._pending_statuses = self._pending_statuses, {}
+        if not statuses_to_save:
+            return True # Already written by the save this one queued behind
+        fast_rewrite = is_truthy_setting(self.settings.get(_SETTINGS_COLS["fast_save"]))
+        saved = perform_batch_update(self.excel_file, statuses_to_save, fast_rewrite, self.phone_row_index, self.status_workbook)
+        if not saved:
+            with self._save_lock: # Carried into the next save; newer statuses for the same phones win
+                self._pending_statuses = {**statuses_to_save, **self._pending_statuses}
+        return saved
+
+    def _wait_for_saves(self, timeout: float) -> bool:
+        """Waits for queued saves to finish; False if they are still running after timeout seconds."""
+        future = self._save_future
+        if future is None:
+            return True
+        try:
+            future.result(timeout=timeout)
+        except FutureTimeoutError:
+            log_system("Warning: Batch update is taking a long time.")
+            return False
+        except Exception as e:
+            log_system(f"Error during batch update: {e}")
+        return True
+
+    def _periodic_status_flush(self):
+        """Saves statuses collected so far while a run is active, without blocking the GUI thread."""
+        if not self.excel_file or not (self.processing_thread and self.processing_thread.is_alive()):
+            return
+        statuses_to_save = self._drain_status_queue()
+        if statuses_to_save:
+            self._request_save(statuses_to_save)
+
     def stop_blaster(self):
         if self.processing_thread and self.processing_thread.is_alive():
             log_system("--- Sending STOP signal ---")
@@ -2125,17 +3839,40 @@ class WhatsAppBlasterGUI(QMainWindow):
         layout.addLayout(button_box)
         coder_win.exec()
 
+    @staticmethod
+    def _run_codec(mode: str, msg: str) -> str:
+        if mode == 'encode':
+            # Same output as quote_plus, without its str -> bytes round trip
+            return urllib.parse.quote_from_bytes(msg.encode("utf-8"), safe="").replace("%20", "+")
+        return urllib.parse.unquote_plus(msg)
+
     def handle_codec(self, mode, input_widget, output_widget):
         msg = input_widget.toPlainText().strip()
         if not msg: output_widget.clear(); return
+        if len(msg) <= _CODEC_SYNC_MAX_CHARS:
+            try:
+                output_widget.setPlainText(self._run_codec(mode, msg))
+            except Exception as e:
+                self._on_codec_failed(mode, str(e))
+            return
+
+        # Large pastes would freeze the window; the result arrives via signals
+        def run():
+            try:
+                self.signals.codec_done.emit(output_widget, self._run_codec(mode, msg))
+            except Exception as e:
+                self.signals.codec_failed.emit(mode, str(e))
+
+        self.background_tasks.submit(run)
+
+    def _on_codec_done(self, output_widget, result: str):
         try:
-            if mode == 'encode':
-                result = urllib.parse.quote_plus(msg)
-            else:
-                result = urllib.parse.unquote_plus(msg)
             output_widget.setPlainText(result)
-        except Exception as e:
-            QMessageBox.critical(self, "Codec Error", f"Processing failed: {str(e)}"); log_system(f"Codec error ({mode}): {e}")
+        except RuntimeError:
+            pass # The coder window was closed meanwhile
+
+    def _on_codec_failed(self, mode: str, error: str):
+        QMessageBox.critical(self, "Codec Error", f"Processing failed: {error}"); log_system(f"Codec error ({mode}): {error}")
 
     def copy_to_clipboard(self, text_widget):
         clipboard = QApplication.clipboard()
@@ -2147,31 +3884,53 @@ class WhatsAppBlasterGUI(QMainWindow):
 
     def delete_temp_folders(self):
         temp_dir = Path(tempfile.gettempdir())
-        folders_to_delete = [f"whatsapp_blaster_data_{i}" for i in [1, 2]]
-        folders_to_delete.append("wa_blaster_gdrive_downloads_cache")
+        legacy_cache_name = "wa_blaster_gdrive_downloads_cache" # Pre-persistent cache location
 
         deleted_count, error_count, not_found_count = 0, 0, 0
-        reply = QMessageBox.question(self, "Confirm Delete", "Delete cached browser data?\nThis might require QR scan again.", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+        reply = QMessageBox.question(self, "Confirm Delete", "Delete cached browser data and Google Drive downloads?\nThis might require QR scan again.", QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
         
         if reply == QMessageBox.StandardButton.Yes:
             log_system("Attempting to delete browser data folders...")
-            for folder in folders_to_delete:
-                folder_path = temp_dir / folder
-                if folder_path.exists() and folder_path.is_dir():
+            # One listing of the temp dir finds every instance profile (any pool size) and the legacy cache
+            folders_to_delete: List[Path] = []
+            try:
+                with os.scandir(temp_dir) as entries:
+                    for entry in entries:
+                        if entry.name.startswith("whatsapp_blaster_data_") or entry.name == legacy_cache_name:
+                            if entry.is_dir(follow_symlinks=False):
+                                folders_to_delete.append(Path(entry.path))
+                            else:
+                                log_system(f"Path exists but not a directory: {entry.path}")
+                                error_count += 1
+            except OSError as e:
+                log_system(f"Could not list {temp_dir}: {e}")
+            path_kind = classify_path(GDRIVE_CACHE_DIR)
+            if path_kind == "dir":
+                folders_to_delete.append(GDRIVE_CACHE_DIR)
+            elif path_kind != "missing":
+                log_system(f"Path exists but not a directory: {GDRIVE_CACHE_DIR}")
+                error_count += 1
+            else:
+                log_system(f"Folder not found: {GDRIVE_CACHE_DIR}")
+                not_found_count += 1
+            if not folders_to_delete:
+                log_system("No browser data folders found.")
+
+            ExcelDataLoader.clear_cache() # Cached loaders point at the Drive downloads being deleted
+
+            # Profiles hold thousands of small files; delete the folders concurrently
+            with ThreadPoolExecutor(max_workers=max(1, len(folders_to_delete)), thread_name_prefix="CacheDelete") as pool:
+                futures = {pool.submit(shutil.rmtree, folder_path): folder_path for folder_path in folders_to_delete}
+                for future in as_completed(futures):
+                    folder_path = futures[future]
                     try:
-                        shutil.rmtree(folder_path)
+                        future.result()
                         log_system(f"Deleted: {folder_path}")
                         deleted_count += 1
                     except Exception as e:
                         log_system(f"Error deleting {folder_path}: {e}")
                         QMessageBox.critical(self, "Deletion Error", f"Could not delete:\n{folder_path}\nError: {e}")
                         error_count += 1
-                elif folder_path.exists():
-                    log_system(f"Path exists but not a directory: {folder_path}")
-                    error_count += 1
-                else:
-                    log_system(f"Folder not found: {folder_path}")
-                    not_found_count +=1
 
             summary = f"Deletion complete.\nDeleted: {deleted_count}\nFailed: {error_count}\nNot Found: {not_found_count}"
             QMessageBox.information(self, "Deletion Complete", summary); log_system(f"Folder deletion summary: {summary}")
@@ -2192,18 +3951,15 @@ class WhatsAppBlasterGUI(QMainWindow):
                 self.stop_event.set()
         if allow_close:
             log_system("Cleaning up...")
-            self._save_pending_updates()
-            self.quit_browsers(); time.sleep(0.5)
+            self._save_pending_updates(wait=True)
+            try:
+                self.quit_browsers().result(timeout=_QUIT_WAIT_S) # Returns as soon as every browser has quit
+            except FutureTimeoutError:
+                log_system("Browsers are still closing; exiting anyway.")
             log_system("Cleanup finished. Exiting.")
             event.accept()
 
 if __name__ == "__main__":
-    logging.basicConfig(
-        level=logging.INFO, 
-        format="%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s",
-        handlers=[logging.FileHandler("whatsapp_blaster.log", encoding='utf-8'),
-        logging.StreamHandler()]
-    )
     app = QApplication(sys.argv)
     window = WhatsAppBlasterGUI()
     window.show()